@@ -10,19 +10,30 @@ Usage:
 """
 
 import argparse
-import sys
+import asyncio
+import traceback
 from nicegui import ui, app
 
+# Estimated pixel heights used to pre-size lazy month placeholders so the
+# calendar scrollbar stays accurate before the grids are materialized
+MONTH_HEADER_HEIGHT_PX = 30
+DAY_ROW_HEIGHT_PX = 36
+CALENDAR_VIEWPORT_HEIGHT_PX = 600
+CALENDAR_PREFETCH_MARGIN_PX = 400
+
+# Serve the application stylesheet as a cacheable static file (see static/app.css)
+app.add_static_files('/static', 'static')
+
 # Import core modules
 import config
 from logger import setup_logging, log_info, log_error
 from utils import (
     set_verbose_mode, verbose_print, format_time_display,
-    get_calendar_date_string, get_current_season, advance_calendar_date, get_current_holiday,
-    get_moon_phase_info, advance_lunar_day, set_lunar_day_to_phase, adjust_lunar_day,
+    get_calendar_date_string, get_current_season, advance_time, get_current_holiday,
+    get_moon_phase_info, set_lunar_day_to_phase, adjust_lunar_day,
     initialize_lunar_day, MOON_PHASES
 )
-from data_loader import load_all_data, save_calendar_date
+from data_loader import load_all_data, save_calendar_date, ensure_calendar_cache
 from overland_logic import (
     overland_reset, overland_new_day, overland_regenerate_day,
     regenerate_individual_weather, regenerate_individual_overland_encounter
@@ -43,17 +54,23 @@ def parse_arguments():
 
 def reset_expansion_states(mode: str = "all"):
     """Reset encounter expansion states."""
+    keys = []
     if mode == "all" or mode == "overland":
-        for watch in config.OVERLAND_WATCHES:
-            key = f"expanded_overland_{watch}"
-            if key in app.storage.user:
-                app.storage.user[key] = False
-    
+        keys += [f"expanded_overland_{watch}" for watch in config.OVERLAND_WATCHES]
+
     if mode == "all" or mode == "site":
-        for slot in config.SITE_TIME_SLOTS:
-            key = f"expanded_site_{slot}"
-            if key in app.storage.user:
-                app.storage.user[key] = False
+        keys += [f"expanded_site_{slot}" for slot in config.SITE_TIME_SLOTS]
+
+    # Single batched write instead of one persistence tick per key
+    updates = {key: False for key in keys if key in app.storage.user}
+    if updates:
+        app.storage.user.update(updates)
+
+
+# Pre-formatted HTML templates for encounter details - hoisted out of the
+# render loop so each refresh only fills in the values
+_DESC_TMPL = '<div style="margin: 0; padding: 0; margin-left: 2em; line-height: 1.2;">Description: %s</div>'
+_SPARK_TMPL = '<div style="margin: 0; padding: 0; margin-left: 2em; margin-bottom: %s; line-height: 1.2;">%d. %s</div>'
 
 
 def render_encounter(encounter: Encounter, label: str, mode: str, refresh_func):
@@ -69,9 +86,9 @@ def render_encounter(encounter: Encounter, label: str, mode: str, refresh_func):
             should_emphasize = (mode == "overland") or (mode == "site" and label == "Current")
             
             if should_emphasize:
-                display_text = f'{label}: <span class="emphasis">{encounter.name}</span>'
+                display_text = f'{label}: <span class="emphasis">{encounter.name_html}</span>'
             else:
-                display_text = f'{label}: {encounter.name}'
+                display_text = f'{label}: {encounter.name_html}'
             
             # Regenerate button callback
             def regen():
@@ -92,49 +109,45 @@ def render_encounter(encounter: Encounter, label: str, mode: str, refresh_func):
                     # Regenerate button
                     ui.button('🔄', on_click=regen).props('flat dense')
                 
-                # Expandable content container (created SECOND so it appears below)
-                # Remove all padding, margins, and gap for ultra-tight spacing
-                details_container = ui.column().classes('mt-0 mb-0 gap-0').style('padding: 0 !important; margin: 0 !important; gap: 0 !important;')
-                
+                # Expandable content - one pre-built HTML blob instead of a
+                # column of widgets (description + one element per spark)
+                details_html = ''
+                if encounter.description_html:
+                    details_html += _DESC_TMPL % encounter.description_html
+                if encounter.sparks_html:
+                    last = len(encounter.sparks_html)
+                    details_html += ''.join(
+                        _SPARK_TMPL % ("0.3em" if i == last else "0", i, spark)
+                        for i, spark in enumerate(encounter.sparks_html, 1)
+                    )
+
+                details_container = ui.html(details_html, sanitize=False).classes('mt-0 mb-0')
+
                 # For site mode, check if this encounter should be initially expanded
                 if mode == "site":
-                    expansions = app.storage.user.get('site_expansions', {})
-                    details_container.visible = expansions.get(label, False)
+                    expansions = app.storage.user.get('site_expansions') or []
+                    slot_idx = config.SITE_SLOT_INDEX[label]
+                    expanded = slot_idx < len(expansions) and expansions[slot_idx]
                 else:
-                    details_container.visible = False
-                
-                # Toggle function - saves state for site mode
+                    expanded = False
+                if not expanded:
+                    details_container.classes('hidden')
+
+                # Toggle function - flips a CSS class in the browser so the
+                # server never re-renders the details; saves state for site mode
                 def toggle_expand():
-                    details_container.visible = not details_container.visible
-                    
-                    # Save expansion state for site mode so it persists when encounters shift
+                    ui.run_javascript(f'document.getElementById("c{details_container.id}").classList.toggle("hidden")')
+
+                    # Save expansion state for site mode so it persists when
+                    # encounters shift; mutate in place - NiceGUI's observable
+                    # storage tracks nested updates without rewriting the list
                     if mode == "site":
-                        expansions = app.storage.user.get('site_expansions', {})
-                        expansions[label] = details_container.visible
-                        app.storage.user['site_expansions'] = expansions
-                
+                        expansions = app.storage.user['site_expansions']
+                        slot_idx = config.SITE_SLOT_INDEX[label]
+                        expansions[slot_idx] = not expansions[slot_idx]
+
                 # Attach click handler to name
                 name_label.on('click', toggle_expand)
-                
-                # Content inside expandable container
-                with details_container:
-                    # Description - ultra-tight spacing, indented, no padding/margin
-                    if encounter.description:
-                        ui.html(f'''
-                            <div style="margin: 0; padding: 0; margin-left: 2em; line-height: 1.2;">
-                                Description: {encounter.description}
-                            </div>
-                        ''', sanitize=False).classes('mt-0')
-                    
-                    # Sparks - numbered, ultra-tight spacing, minimal margin after last one
-                    if encounter.sparks:
-                        for i, spark in enumerate(encounter.sparks, 1):
-                            bottom_margin = "0.3em" if i == len(encounter.sparks) else "0"
-                            ui.html(f'''
-                                <div style="margin: 0; padding: 0; margin-left: 2em; margin-bottom: {bottom_margin}; line-height: 1.2;">
-                                    {i}. {spark}
-                                </div>
-                            ''', sanitize=False).classes('mt-0')
         else:
             # No encounter - use expansion for vertical alignment, not emphasized
             with ui.expansion(f'{label}: No Encounter', icon='expand_more').classes('mt-0 mb-0').props('disable').style('margin-left: 0 !important; padding-left: 0 !important;'):
@@ -161,7 +174,7 @@ def overland_content():
     # If calendar with date, auto-sync season from calendar
     if has_calendar_date:
         calendar_season = get_current_season()
-        if calendar_season and calendar_season in config.seasons_list:
+        if calendar_season and calendar_season in config.seasons_set:
             config.selected_overland_season = calendar_season
 
     # Dropdowns - season dropdown conditional on calendar state
@@ -198,26 +211,27 @@ def overland_content():
         reset_expansion_states("overland")
         # Advance calendar date if calendar with date is active
         if has_calendar_date:
-            advance_calendar_date(1)
-            # Advance lunar day if lunar tracking is active
-            if config.calendar_data.get('lunar_cycle_length'):
-                advance_lunar_day(1)
+            # One combined save covers the date and (if tracked) the moon
+            advance_time(1)
             # Update season from calendar (in case month changed)
             new_season = get_current_season()
-            if new_season and new_season in config.seasons_list:
+            if new_season and new_season in config.seasons_set:
                 config.selected_overland_season = new_season
         overland_new_day()
         overland_content.refresh()
-        calendar_content.refresh()
+        refresh_calendar_if_active()
 
     with ui.row().classes('gap-2 mt-1 mb-1'):
         ui.button('New Day', on_click=handle_new_day)
         ui.button('Regenerate All', on_click=lambda: (reset_expansion_states("overland"), overland_regenerate_day(), overland_content.refresh()))
         ui.button('Reset', on_click=lambda: (reset_expansion_states("overland"), overland_reset(), overland_content.refresh()))
 
-    # General section
+    # General section - pre-rendered as one HTML blob so a refresh diffs a
+    # single element instead of five separate labels
     ui.label('General').classes('text-lg font-bold mt-0 mb-0')
 
+    general_parts = []
+
     # Date display (if calendar active)
     if has_calendar:
         date_string = get_calendar_date_string()
@@ -235,39 +249,38 @@ def overland_content():
                     moon_html = f'&nbsp;&nbsp;{moon_phase["icon"]} {moon_phase["name"]}'
                 date_html += moon_html
 
-            ui.html(date_html, sanitize=False).classes('mt-0 mb-0 ml-4')
+            general_parts.append(f'<div>{date_html}</div>')
 
             # Holiday display (if current date is a holiday)
             current_holiday = get_current_holiday()
             if current_holiday:
-                holiday_text = f"{current_holiday.get('name', '')} - {current_holiday.get('description', '')}"
-                ui.label(holiday_text).classes('mt-0 mb-0 ml-4 text-sm')
+                general_parts.append(
+                    f'<div class="text-sm">{current_holiday.get("_name_html", "")} - '
+                    f'{current_holiday.get("_description_html", "")}</div>'
+                )
 
     # Days count
-    ui.label(f'{config.generated_overland_days} days').classes('mt-0 mb-0 ml-4')
-    
-    # Weather - indented under General
-    if config.generated_overland_weather and config.generated_overland_weather.name:
-        with ui.row().classes('items-center gap-0 mt-0 mb-0 ml-4'):
-            # Parse weather string to emphasize only the name
-            weather_str = str(config.generated_overland_weather)
-            if '(' in weather_str:
-                # Format: "Name (effects)"
-                name_part = weather_str.split('(')[0].strip()
-                effects_part = '(' + weather_str.split('(', 1)[1]
-                ui.html(f'Weather: <span class="emphasis">{name_part}</span> {effects_part}', sanitize=False)
-            else:
-                # Just the name
-                ui.html(f'Weather: <span class="emphasis">{weather_str}</span>', sanitize=False)
-            ui.button('🔄', on_click=lambda: (regenerate_individual_weather(), overland_content.refresh())).props('flat dense')
+    general_parts.append(f'<div>{config.generated_overland_days} days</div>')
+
+    # Weather - precomputed HTML on the Weather object
+    has_weather = config.generated_overland_weather and config.generated_overland_weather.name
+    if has_weather:
+        general_parts.append(f'<div>{config.generated_overland_weather.display_html}</div>')
     else:
-        ui.label('No weather generated yet').classes('mt-0 mb-0 ml-4 text-gray-500')
-    
+        general_parts.append('<div class="text-gray-500">No weather generated yet</div>')
+
+    with ui.row().classes('items-end gap-0 mt-0 mb-0 ml-4'):
+        ui.html(''.join(general_parts), sanitize=False).classes('mt-0 mb-0')
+        # The regenerate button needs a server callback, so it stays a widget
+        if has_weather:
+            ui.button('🔄', on_click=lambda: (regenerate_individual_weather(), overland_content.refresh())).props('flat dense')
+
     # Encounters section
     ui.label('Encounters').classes('text-lg font-bold mt-0 mb-0')
     
+    encounters = config.generated_overland_encounters
     for watch in config.OVERLAND_WATCHES:
-        encounter = config.generated_overland_encounters.get(watch)
+        encounter = encounters.get(watch)
         if encounter:
             render_encounter(encounter, watch, "overland", overland_content)
     
@@ -277,31 +290,39 @@ def overland_content():
     if config.generated_overland_rest_info:
         rest_info = config.generated_overland_rest_info
         
+        # Each section is emitted as one concatenated HTML block instead of
+        # one ui.label per row
+
         # Rest DCs - indented
         ui.label(f'Rest DCs for {config.selected_overland_season}').classes('font-bold mt-0 mb-0 ml-4')
         rest_dcs = rest_info.get('rest_dcs', [])
         if rest_dcs:
-            with ui.column().classes('mt-0 mb-0 ml-8'):
-                for item in rest_dcs:
-                    ui.label(f"{item.get('camp', '')}  {item.get('dc', '')}").classes('mt-0 mb-0')
-        
+            dcs_html = ''.join(
+                f'<div class="mt-0 mb-0">{item.get("camp", "")}&nbsp;&nbsp;{item.get("dc", "")}</div>'
+                for item in rest_dcs
+            )
+            ui.html(dcs_html, sanitize=False).classes('mt-0 mb-0 ml-8')
+
         # Weather Modifiers (only if exist) - indented
         weather_mods = rest_info.get('weather_modifiers', [])
         if weather_mods:
             ui.label('Weather Modifiers').classes('font-bold mt-0 mb-0 ml-4')
-            with ui.column().classes('mt-0 mb-0 ml-8'):
-                for mod in weather_mods:
-                    # Emphasize the weather effect
-                    mod_text = f"{mod.get('description', '')}  {mod.get('modifier', '')}"
-                    ui.html(f'<span class="emphasis">{mod_text}</span>', sanitize=False).classes('mt-0 mb-0')
-        
+            # Emphasize the weather effects
+            mods_html = ''.join(
+                f'<div class="mt-0 mb-0"><span class="emphasis">{mod.get("description", "")}&nbsp;&nbsp;{mod.get("modifier", "")}</span></div>'
+                for mod in weather_mods
+            )
+            ui.html(mods_html, sanitize=False).classes('mt-0 mb-0 ml-8')
+
         # Situational Modifiers - indented
         ui.label('Situational Modifiers').classes('font-bold mt-0 mb-0 ml-4')
         situational_mods = rest_info.get('situational_modifiers', [])
         if situational_mods:
-            with ui.column().classes('mt-0 mb-0 ml-8'):
-                for mod in situational_mods:
-                    ui.label(f"{mod.get('situation', '')}  {mod.get('modifier', '')}").classes('mt-0 mb-0')
+            sit_html = ''.join(
+                f'<div class="mt-0 mb-0">{mod.get("situation", "")}&nbsp;&nbsp;{mod.get("modifier", "")}</div>'
+                for mod in situational_mods
+            )
+            ui.html(sit_html, sanitize=False).classes('mt-0 mb-0 ml-8')
     else:
         ui.label('No rest information generated yet').classes('mt-0 mb-0 ml-4 text-gray-500')
 
@@ -330,10 +351,9 @@ def site_content():
     ui.label('General').classes('text-lg font-bold mt-0 mb-0')
     time_str = format_time_display(config.generated_site_time)
     # Emphasize only "X minutes" part, not the "(H hours M minutes)" part
-    if '(' in time_str:
-        minutes_part = time_str.split('(')[0].strip()
-        hours_part = '(' + time_str.split('(', 1)[1]
-        ui.html(f'<span class="emphasis">{minutes_part}</span> {hours_part}', sanitize=False).classes('mt-0 mb-0 ml-4')
+    minutes_part, sep, hours_part = time_str.partition('(')
+    if sep:
+        ui.html(f'<span class="emphasis">{minutes_part.strip()}</span> {sep}{hours_part}', sanitize=False).classes('mt-0 mb-0 ml-4')
     else:
         ui.html(f'<span class="emphasis">{time_str}</span>', sanitize=False).classes('mt-0 mb-0 ml-4')
     
@@ -363,32 +383,81 @@ def site_content():
             ui.button('Add Timer', on_click=add_timer_action)
             ui.button('Cancel', on_click=cancel_timer)
     
-    # Display timers - indented
+    # Display timers in expiry order - indented (the heap itself is only
+    # partially ordered, so sort the handful of entries for display)
     if config.generated_site_timers:
         with ui.column().classes('w-full mt-0 mb-0 ml-4'):
-            for i, timer in enumerate(config.generated_site_timers):
+            for i, (_, _, timer) in enumerate(sorted(config.generated_site_timers)):
                 with ui.row().classes('w-full items-center gap-0 mt-0 mb-0'):
-                    # Emphasize name only if "Current:"
-                    timer_str = str(timer)
-                    if timer_str.startswith('Current:'):
-                        # Parse "Current: Name" and emphasize only the name
-                        timer_name = timer_str.split(':', 1)[1].strip()
-                        ui.html(f'Current: <span class="emphasis">{timer_name}</span>', sanitize=False)
-                    else:
-                        # Normal timer display
-                        ui.label(timer_str)
-                    
-                    ui.button('❌', on_click=lambda idx=i: (site_delete_timer(idx), site_content.refresh())).props('flat dense')
+                    # HTML is precomputed on the Timer object whenever it changes
+                    ui.html(timer.display_html, sanitize=False)
+
+                    # Delete button - handled by the delegated 'timer_delete' listener
+                    ui.html(f'<button class="q-btn" data-timer-idx="{i}">❌</button>', sanitize=False)
     else:
         ui.label('No active timers').classes('mt-0 mb-0 ml-4 text-gray-500')
     
     # Encounters section
     ui.label('Encounters').classes('text-lg font-bold mt-0 mb-0')
     
-    for time_slot in config.SITE_TIME_SLOTS:
-        encounter = config.generated_site_encounters.get(time_slot)
-        if encounter:
-            render_encounter(encounter, time_slot, "site", site_content)
+    # Ring buffer is in SITE_TIME_SLOTS order ("Current" first)
+    for time_slot, encounter in zip(config.SITE_TIME_SLOTS, config.generated_site_encounters):
+        render_encounter(encounter, time_slot, "site", site_content)
+
+
+# Delegated click listeners: one document-level JS handler per button family
+# posts the clicked element's data attributes back instead of one Python
+# closure per button
+_CLICK_DELEGATE_JS = '''
+    <script>
+        document.addEventListener('click', (e) => {
+            const day = e.target.closest('button[data-cal-m]');
+            if (day) emitEvent('calendar_day_click', {m: +day.dataset.calM, d: +day.dataset.calD});
+            const del = e.target.closest('button[data-timer-idx]');
+            if (del) emitEvent('timer_delete', {idx: +del.dataset.timerIdx});
+        });
+    </script>
+'''
+
+# Page title markup - state-independent, so built once at import
+_TITLE_HTML = '''
+    <h1 style="font-family: 'GreyhawkGothic', 'Grenze Gotisch', 'UnifrakturMaguntia', serif;
+               font-size: 2rem;
+               margin-bottom: 0.5rem;
+               margin-top: 0;">
+        Torchcrawl GM Control Panel
+    </h1>
+'''
+
+
+def handle_timer_delete(e):
+    """Handle a delegated timer delete click (args: {'idx': timer index})."""
+    site_delete_timer(int(e.args['idx']))
+    site_content.refresh()
+
+
+def refresh_calendar_if_active():
+    """Refresh the Calendar tab now if visible, otherwise defer to tab activation."""
+    if app.storage.user.get('active_tab') == 'Calendar':
+        calendar_content.refresh()
+    else:
+        app.storage.user['calendar_dirty'] = True
+
+
+def refresh_overland_if_active():
+    """Refresh the Overland tab now if visible, otherwise defer to tab activation."""
+    if app.storage.user.get('active_tab') == 'Overland':
+        overland_content.refresh()
+    else:
+        app.storage.user['overland_dirty'] = True
+
+
+def handle_calendar_day_click(e):
+    """Handle a delegated calendar day click (args: {'m': month, 'd': day})."""
+    save_calendar_date(int(e.args['m']), int(e.args['d']))
+    refresh_calendar_if_active()
+    # Also refresh overland if it's using calendar season
+    refresh_overland_if_active()
 
 
 @ui.refreshable
@@ -404,97 +473,150 @@ def calendar_content():
     if config.calendar_data.get('lunar_cycle_length') and config.calendar_data.get('lunar_day') is None:
         initialize_lunar_day()
 
-    # Get calendar info
-    months = config.calendar_data.get('months', [])
+    # Get calendar info (derived lookups are cached on calendar_data at load)
+    ensure_calendar_cache()
+    months = config.calendar_data['_months']
     holidays = config.calendar_data.get('holidays', [])
-    days_per_week = config.calendar_data.get('days_per_week', 6)
+    days_per_week = config.calendar_data['_days_per_week']
     current_date = config.calendar_data.get('current_date')
+    holiday_lookup = config.calendar_data['_holiday_lookup']
 
-    # Build holiday lookup: (month_name, day) -> holiday
-    holiday_lookup = {}
-    for holiday in holidays:
-        key = (holiday.get('month'), holiday.get('day'))
-        holiday_lookup[key] = holiday
+    # Current date display at top - its own refreshable so lunar nudges can
+    # update it without rebuilding the month grids below
+    @ui.refreshable
+    def date_header():
+        date_string = get_calendar_date_string()
+        if date_string:
+            date_html = date_string
 
-    # Current date display at top
-    date_string = get_calendar_date_string()
-    if date_string:
-        date_html = date_string
+            # Add moon phase if available
+            moon_phase = get_moon_phase_info()
+            if moon_phase:
+                if moon_phase.get('is_blood_moon'):
+                    moon_html = f'&nbsp;&nbsp;<span class="blood-moon"></span> <span style="color: #cc2222;">{moon_phase["name"]}</span>'
+                else:
+                    moon_html = f'&nbsp;&nbsp;{moon_phase["icon"]} {moon_phase["name"]}'
+                date_html += moon_html
 
-        # Add moon phase if available
-        moon_phase = get_moon_phase_info()
-        if moon_phase:
-            if moon_phase.get('is_blood_moon'):
-                moon_html = f'&nbsp;&nbsp;<span class="blood-moon"></span> <span style="color: #cc2222;">{moon_phase["name"]}</span>'
-            else:
-                moon_html = f'&nbsp;&nbsp;{moon_phase["icon"]} {moon_phase["name"]}'
-            date_html += moon_html
+            ui.html(date_html, sanitize=False).classes('text-lg font-bold mt-0 mb-0')
 
-        ui.html(date_html, sanitize=False).classes('text-lg font-bold mt-0 mb-0')
+        # If current date is a holiday, show holiday info
+        current_holiday = get_current_holiday()
+        if current_holiday:
+            with ui.column().classes('mt-0 mb-1 ml-4 gap-0'):
+                ui.html(f'🎉 <span class="emphasis">{current_holiday.get("name", "")}</span>', sanitize=False).classes('mt-0 mb-0')
+                ui.label(current_holiday.get('description', '')).classes('mt-0 mb-0 text-sm')
 
-    # If current date is a holiday, show holiday info
+    date_header()
     current_holiday = get_current_holiday()
-    if current_holiday:
-        with ui.column().classes('mt-0 mb-1 ml-4 gap-0'):
-            ui.html(f'🎉 <span class="emphasis">{current_holiday.get("name", "")}</span>', sanitize=False).classes('mt-0 mb-0')
-            ui.label(current_holiday.get('description', '')).classes('mt-0 mb-0 text-sm')
 
     ui.separator().classes('my-2')
 
-    # Render all month grids
-    for month_idx, month in enumerate(months, 1):
+    # Render month grids lazily: each month gets a pre-sized placeholder and
+    # the day buttons are only built once the month scrolls near the viewport.
+    # This keeps first paint at a handful of widgets instead of ~360 buttons.
+    def build_month_grid(container, month_idx: int, month: dict):
+        """Materialize the day-button grid for a single month.
+
+        Days are emitted as plain HTML buttons with data attributes; a single
+        delegated JS listener (installed in index()) posts clicks back as one
+        'calendar_day_click' event instead of one handler closure per day.
+        """
         month_name = month.get('name', f'Month {month_idx}')
         days_in_month = month.get('days', 30)
 
-        # Month header
-        ui.label(month_name).classes('calendar-month-header')
-
-        # Create grid for this month
-        with ui.grid(columns=days_per_week).classes('gap-0'):
-            for day in range(1, days_in_month + 1):
-                # Determine styling
-                is_current = (current_date and
-                              current_date.get('month') == month_idx and
-                              current_date.get('day') == day)
-                is_holiday = (month_name, day) in holiday_lookup
-
-                # Build CSS classes
-                btn_classes = 'calendar-day'
-                if is_current:
-                    btn_classes += ' calendar-day-current'
-                if is_holiday:
-                    btn_classes += ' calendar-day-holiday'
-
-                # Create day button with closure for correct values
-                def make_click_handler(m=month_idx, d=day):
-                    def handler():
-                        save_calendar_date(m, d)
-                        calendar_content.refresh()
-                        # Also refresh overland if it's using calendar season
-                        overland_content.refresh()
-                    return handler
-
-                btn = ui.button(str(day), on_click=make_click_handler()).props('flat dense')
-                btn.classes(btn_classes)
-
-                # Add tooltip for holidays
-                if is_holiday:
-                    holiday_info = holiday_lookup[(month_name, day)]
-                    btn.tooltip(holiday_info.get('name', ''))
-
-    # Lunar phase selector (if lunar tracking is enabled)
-    if config.calendar_data.get('lunar_cycle_length'):
+        cells = []
+        for day in range(1, days_in_month + 1):
+            # Determine styling
+            is_current = (current_date and
+                          current_date.get('month') == month_idx and
+                          current_date.get('day') == day)
+            is_holiday = (month_idx, day) in holiday_lookup
+
+            # Build CSS classes
+            btn_classes = 'q-btn calendar-day'
+            if is_current:
+                btn_classes += ' calendar-day-current'
+            if is_holiday:
+                btn_classes += ' calendar-day-holiday'
+
+            # Tooltip for holidays via the title attribute
+            title = ''
+            if is_holiday:
+                title = f' title="{holiday_lookup[(month_idx, day)].get("_name_html", "")}"'
+
+            cells.append(
+                f'<button class="{btn_classes}" data-cal-m="{month_idx}" data-cal-d="{day}"{title}>{day}</button>'
+            )
+
+        grid_html = (
+            f'<div style="display: grid; grid-template-columns: repeat({days_per_week}, minmax(0, 1fr)); gap: 0;">'
+            + ''.join(cells)
+            + '</div>'
+        )
+
+        with container:
+            ui.label(month_name).classes('calendar-month-header')
+            ui.html(grid_html, sanitize=False).classes('w-full')
+
+    # Placeholder containers, pre-sized so the scrollbar stays accurate
+    pending_months = {}   # month_idx -> (container, month dict)
+    month_offsets = {}    # month_idx -> (top_px, height_px)
+
+    def estimate_month_height(month: dict) -> int:
+        days_in_month = month.get('days', 30)
+        rows = -(-days_in_month // days_per_week)  # ceiling division
+        return MONTH_HEADER_HEIGHT_PX + rows * DAY_ROW_HEIGHT_PX
+
+    def build_visible_months(scroll_px: float):
+        """Build any pending month whose placeholder is near the viewport."""
+        window_top = scroll_px - CALENDAR_PREFETCH_MARGIN_PX
+        window_bottom = scroll_px + CALENDAR_VIEWPORT_HEIGHT_PX + CALENDAR_PREFETCH_MARGIN_PX
+        for idx in list(pending_months):
+            top, height = month_offsets[idx]
+            if top < window_bottom and top + height > window_top:
+                container, month = pending_months.pop(idx)
+                container.style('min-height: 0')
+                build_month_grid(container, idx, month)
+
+    scroll = ui.scroll_area().classes('w-full').style(f'height: {CALENDAR_VIEWPORT_HEIGHT_PX}px')
+    with scroll:
+        offset = 0
+        for month_idx, month in enumerate(months, 1):
+            height = estimate_month_height(month)
+            container = ui.column().classes('gap-0 w-full').style(f'min-height: {height}px')
+            pending_months[month_idx] = (container, month)
+            month_offsets[month_idx] = (offset, height)
+            offset += height
+
+    scroll.on_scroll(lambda e: build_visible_months(e.vertical_position))
+
+    # Materialize the first viewport immediately, plus the current month so the
+    # highlighted day is always built
+    build_visible_months(0)
+    if current_date and current_date.get('month') in month_offsets:
+        current_top = month_offsets[current_date['month']][0]
+        build_visible_months(current_top)
+
+    # Lunar phase selector (if lunar tracking is enabled) - also its own
+    # refreshable; nudging the moon only redraws this row and the date header
+    @ui.refreshable
+    def lunar_row():
         moon_phase = get_moon_phase_info()
         current_phase_index = moon_phase['phase_index'] if moon_phase else -1
 
+        def refresh_lunar_display():
+            lunar_row.refresh()
+            date_header.refresh()
+            refresh_overland_if_active()
+
         with ui.row().classes('items-center gap-1 mt-2 mb-1'):
             ui.label('Lunar Phase:').classes('mr-2')
 
             # Minus button
             def handle_lunar_minus():
                 adjust_lunar_day(-1)
-                calendar_content.refresh()
-                overland_content.refresh()
+                refresh_lunar_display()
             ui.button('−', on_click=handle_lunar_minus).props('flat dense').classes('lunar-phase-btn')
 
             # Phase icon buttons
@@ -502,23 +624,26 @@ def calendar_content():
                 def make_phase_handler(phase_idx=idx):
                     def handler():
                         set_lunar_day_to_phase(phase_idx)
-                        calendar_content.refresh()
-                        overland_content.refresh()
+                        refresh_lunar_display()
                     return handler
 
                 btn_classes = 'lunar-phase-btn'
                 if idx == current_phase_index:
                     btn_classes += ' lunar-phase-current'
 
-                ui.button(phase['icon'], on_click=make_phase_handler()).props('flat dense').classes(btn_classes).tooltip(phase['name'])
+                # Classes and tooltip are baked into construction: the title
+                # attribute replaces a ui.tooltip sub-component per button
+                ui.button(phase['icon'], on_click=make_phase_handler()).props(f'flat dense title="{phase["name"]}"').classes(btn_classes)
 
             # Plus button
             def handle_lunar_plus():
                 adjust_lunar_day(1)
-                calendar_content.refresh()
-                overland_content.refresh()
+                refresh_lunar_display()
             ui.button('+', on_click=handle_lunar_plus).props('flat dense').classes('lunar-phase-btn')
 
+    if config.calendar_data.get('lunar_cycle_length'):
+        lunar_row()
+
     ui.separator().classes('my-2')
 
     # Holiday list at bottom
@@ -561,155 +686,47 @@ def toggle_timer_form():
 def index():
     """Main application page."""
 
+    # Data may still be loading in the startup task - show a splash and
+    # reload once it finishes instead of blocking the first paint
+    if not config.data_ready:
+        dark = ui.dark_mode()
+        dark.auto()
+        with ui.column().classes('absolute-center items-center'):
+            if config.data_load_error:
+                ui.label('Failed to load data files. Check logs/TCControlPanel.log for details.')
+                return
+            ui.spinner(size='lg')
+            ui.label('Loading data...')
+
+        def check_ready():
+            if config.data_ready or config.data_load_error:
+                splash_timer.deactivate()
+                ui.navigate.reload()
+
+        splash_timer = ui.timer(0.3, check_ready)
+        return
+
     # Initialize UI state - ensure timer form starts collapsed
     app.storage.user['show_timer_form'] = False
+    # One bool per site slot, in ring order (legacy dict values are replaced)
+    if not isinstance(app.storage.user.get('site_expansions'), list):
+        app.storage.user['site_expansions'] = [False] * len(config.SITE_TIME_SLOTS)
 
     # Enable dark mode - auto-detect from system
     dark = ui.dark_mode()
     dark.auto()  # Automatically follow system dark/light mode preference
     
-    # Custom CSS for additional spacing control
-    ui.add_head_html('''
-        <style>
-            /* Emphasis color - coral pink */
-            .emphasis {
-                color: #F78080 !important;
-                font-weight: 500;
-            }
-            
-            /* Ultra-tight overall spacing */
-            .nicegui-content {
-                padding-top: 0.5rem !important;
-                line-height: 1.2 !important;
-            }
-            /* Minimal spacing between all elements */
-            .q-field {
-                margin-bottom: 0.1rem !important;
-            }
-            /* No spacing for expansion items */
-            .q-expansion-item__container {
-                margin-bottom: 0rem !important;
-            }
-            /* Remove expansion indentation - flush left */
-            .q-expansion-item {
-                margin-left: 0 !important;
-                padding-left: 0 !important;
-                margin-bottom: 0 !important;
-            }
-            .q-item {
-                padding-left: 0 !important;
-                min-height: 0 !important;
-                padding-top: 0.1rem !important;
-                padding-bottom: 0.1rem !important;
-            }
-            /* Hide expansion icon to remove indentation */
-            .q-expansion-item .q-item__section--side {
-                display: none !important;
-            }
-            /* Left-align tabs - multiple selectors for specificity */
-            .q-tabs,
-            .q-tabs__content {
-                justify-content: flex-start !important;
-            }
-            .q-tabs .q-tabs__content {
-                justify-content: flex-start !important;
-            }
-            /* Normal case for tabs instead of all caps */
-            .q-tab__label {
-                text-transform: none !important;
-            }
-            /* Tighter labels */
-            .q-field__label {
-                font-size: 0.875rem !important;
-            }
-            /* Reduce button padding */
-            .q-btn {
-                min-height: 1.5rem !important;
-                padding: 0.1rem 0.3rem !important;
-            }
-            /* Tighter text elements */
-            p, div {
-                margin-top: 0 !important;
-                margin-bottom: 0 !important;
-            }
-
-            /* Calendar styles */
-            .calendar-day {
-                min-width: 2.2rem !important;
-                min-height: 2rem !important;
-                padding: 0.2rem !important;
-                margin: 1px !important;
-            }
-            .calendar-day-current,
-            .calendar-day-current .q-btn__content {
-                color: #F78080 !important;
-                font-weight: bold !important;
-            }
-            .calendar-day-holiday {
-                background-color: rgba(255, 193, 7, 0.3) !important;
-            }
-            .calendar-month-header {
-                font-weight: bold;
-                margin-top: 0.5rem;
-                margin-bottom: 0.2rem;
-            }
-
-            /* Blood Moon styles - layered CSS technique */
-            .blood-moon {
-                position: relative;
-                display: inline-block;
-                width: 1em;
-                height: 1em;
-                filter: contrast(1.4);
-                vertical-align: middle;
-                line-height: 1;
-            }
-            .blood-moon::before {
-                content: "🌕";
-                position: absolute;
-                top: -0.1em;
-                left: 0;
-                filter: grayscale(0.95);
-                z-index: 1;
-            }
-            .blood-moon::after {
-                content: "🌕";
-                position: absolute;
-                top: -0.1em;
-                left: 0;
-                z-index: 2;
-                color: transparent;
-                -webkit-background-clip: text;
-                background-clip: text;
-                background-color: rgba(255, 0, 0, 0.5);
-                pointer-events: none;
-            }
-
-            /* Lunar phase selector styles */
-            .lunar-phase-btn {
-                min-width: 2rem !important;
-                min-height: 2rem !important;
-                padding: 0.1rem !important;
-                margin: 0 !important;
-                font-size: 1.2rem !important;
-            }
-            .lunar-phase-current {
-                background-color: rgba(247, 128, 128, 0.3) !important;
-                border: 1px solid #F78080 !important;
-            }
-        </style>
-    ''')
+    # Application stylesheet - served statically so the browser caches it
+    ui.add_head_html('<link rel="stylesheet" href="/static/app.css">')
+
+    # One delegated handler each for calendar day and timer delete buttons
+    ui.add_head_html(_CLICK_DELEGATE_JS)
+    ui.on('calendar_day_click', handle_calendar_day_click)
+    ui.on('timer_delete', handle_timer_delete)
     
     # Page title with custom font
-    ui.html('''
-        <h1 style="font-family: 'GreyhawkGothic', 'Grenze Gotisch', 'UnifrakturMaguntia', serif; 
-                   font-size: 2rem; 
-                   margin-bottom: 0.5rem; 
-                   margin-top: 0;">
-            Torchcrawl GM Control Panel
-        </h1>
-    ''', sanitize=False)
-    
+    ui.html(_TITLE_HTML, sanitize=False)
+
     # Tabs - Calendar tab only shown if calendar is loaded
     with ui.tabs().classes('w-full') as tabs:
         overland_tab = ui.tab('Overland')
@@ -717,51 +734,107 @@ def index():
         if config.calendar_data:
             calendar_tab = ui.tab('Calendar')
 
+    # Track the active tab so background tabs can skip their refresh and
+    # catch up only when shown (see refresh_*_if_active)
+    app.storage.user['active_tab'] = 'Overland'
+
+    def handle_tab_change(e):
+        app.storage.user['active_tab'] = e.args
+        if build_tab(e.args):
+            return  # freshly built content is already up to date
+        if e.args == 'Calendar' and app.storage.user.get('calendar_dirty'):
+            app.storage.user['calendar_dirty'] = False
+            calendar_content.refresh()
+        elif e.args == 'Overland' and app.storage.user.get('overland_dirty'):
+            app.storage.user['overland_dirty'] = False
+            overland_content.refresh()
+
+    tabs.on('update:model-value', handle_tab_change)
+
+    # Panels are built lazily: only the initial Overland tab is rendered at
+    # page setup; Site and Calendar get their content on first activation
     with ui.tab_panels(tabs, value=overland_tab).classes('w-full'):
         with ui.tab_panel(overland_tab):
             overland_content()
 
-        with ui.tab_panel(site_tab):
-            site_content()
-
+        site_panel = ui.tab_panel(site_tab)
         if config.calendar_data:
-            with ui.tab_panel(calendar_tab):
+            calendar_panel = ui.tab_panel(calendar_tab)
+
+    visited = {'Overland'}
+
+    def build_tab(name):
+        """Build a tab panel's content on first visit; returns True if built."""
+        if name in visited:
+            return False
+        visited.add(name)
+        if name == 'Site':
+            with site_panel:
+                site_content()
+        elif name == 'Calendar':
+            app.storage.user['calendar_dirty'] = False
+            with calendar_panel:
                 calendar_content()
+        return True
+
+
+def _load_data():
+    """Load all data and initialize selections (runs in a worker thread)."""
+    try:
+        success = load_all_data()
+
+        if not success:
+            log_error("Application startup failed - data loading error")
+            print("ERROR: Failed to load data files. Check logs/TCControlPanel.log for details.")
+            config.data_load_error = True
+            return
+
+        # Initialize selections if not set
+        if not config.selected_overland_season and config.seasons_list:
+            config.selected_overland_season = config.seasons_list[0]
+        if not config.selected_overland_zone and config.overland_zones_list:
+            config.selected_overland_zone = config.overland_zones_list[0]
+        if not config.selected_site_zone and config.site_zones_list:
+            config.selected_site_zone = config.site_zones_list[0]
+
+        config.data_ready = True
+        verbose_print("=== Application Ready ===")
+    except Exception:
+        # Without this, an exception escaping the background thread is
+        # swallowed and the splash spins forever with no error state
+        log_error(f"Application startup failed - unhandled error during data load:\n{traceback.format_exc()}")
+        print("ERROR: Failed to load data files. Check logs/TCControlPanel.log for details.")
+        config.data_load_error = True
+
+
+# Keep a reference so the startup task isn't garbage-collected mid-load
+_startup_task = None
+
+
+async def _startup():
+    """Kick off data loading in the background so the server serves immediately."""
+    global _startup_task
+    _startup_task = asyncio.create_task(asyncio.to_thread(_load_data))
 
 
 def main():
     """Main application entry point."""
-    
+
     # Parse arguments
     args = parse_arguments()
     set_verbose_mode(args.verbose)
-    
+
     # Setup logging
     setup_logging()
-    
+
     verbose_print("=== Application Starting ===")
     log_info("=" * 60)
     log_info("Torchcrawl GM Control Panel - NiceGUI Version Started")
     log_info("=" * 60)
-    
-    # Load data
-    success = load_all_data()
-    
-    if not success:
-        log_error("Application startup failed - data loading error")
-        print("ERROR: Failed to load data files. Check logs/TCControlPanel.log for details.")
-        sys.exit(1)
-    
-    # Initialize selections if not set
-    if not config.selected_overland_season and config.seasons_list:
-        config.selected_overland_season = config.seasons_list[0]
-    if not config.selected_overland_zone and config.overland_zones_list:
-        config.selected_overland_zone = config.overland_zones_list[0]
-    if not config.selected_site_zone and config.site_zones_list:
-        config.selected_site_zone = config.site_zones_list[0]
-    
-    verbose_print("=== Application Ready ===")
-    
+
+    # Load data off the startup path; the page shows a splash until ready
+    app.on_startup(_startup)
+
     # Run NiceGUI with storage secret
     ui.run(
         title='Torchcrawl GM Control Panel',
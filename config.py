@@ -15,7 +15,9 @@ Functions: None
 Classes: None
 """
 
+from collections import deque
 from typing import Optional, List, Dict
+import numpy as np
 import xarray as xr
 from models import Encounter, Weather, Timer
 
@@ -45,22 +47,51 @@ overland_zones_list: List[str] = []        # Zones with type "Overland"
 overland_overlay_list: List[str] = []      # Zones with type "Overlay"
 site_zones_list: List[str] = []            # Zones with type "Site"
 seasons_list: List[str] = []               # Extracted from weather_by_season column headers
+seasons_set: frozenset = frozenset()       # Same seasons; used for O(1) membership checks
 
 # Structured data (dictionaries/nested structures from YAML)
-zones_data: Dict[str, Dict] = {}           # Zone name -> {types: List[str], encounter_chance: str}
+zones_data: Dict[str, Dict] = {}           # Zone name -> {types, encounter_chance, encounter_chance_f}
 weathers_data: Dict[str, Dict] = {}        # Weather name -> {effects: List[str]}
 encounters_data: Dict[str, Dict] = {}      # Encounter name -> {description, habitat, sparks, watch}
 restinfo_data: Dict = {}                   # Rest check tables and modifiers
+effect_to_modifiers: Dict[str, List] = {}  # Weather effect -> weather modifiers listing it
 
 # xarray DataArrays (multi-dimensional labeled arrays)
 encounter_by_zone: Optional[xr.DataArray] = None              # 2D: [Encounter, Zone]
+encounter_by_zone_values: Optional[np.ndarray] = None         # Same weights as a raw float32 matrix
+encounter_row_idx: Dict[str, int] = {}                        # Encounter name -> row in the matrix
+encounter_col_idx: Dict[str, int] = {}                        # Zone name -> column in the matrix
 encounter_by_zone_and_watch: Optional[xr.DataArray] = None    # 3D: [Encounter, Zone, Watch]
 weather_by_season: Optional[xr.DataArray] = None              # 2D: [Weather, Season]
+weather_labels: List[str] = []                                # Weather names in matrix row order
+
+# Precomputed weighted-selection caches (built by data_loader after the 3D
+# array is assembled): value tuples are (names, weights, prob, alias) where
+# prob/alias form a Walker/Vose alias table for O(1) draws
+enc_weights: Dict = {}                                        # (zone, watch) -> tuple
+enc_weights_site: Dict = {}                                   # zone -> tuple
+weather_weights: Dict = {}                                    # season -> tuple
+weather_weights_no_nc: Dict = {}                              # season -> (names, weights, cumulative, total) without "No Change" (Day-1 draws)
+
+# Fused occurrence + selection CDFs: each encounter's weight is scaled by
+# the zone's encounter chance and the final slot means "no encounter", so a
+# single uniform draw decides both whether and which. Value tuples are
+# (names, weights, cum_ext, total).
+enc_fused: Dict = {}                                          # (zone, watch) -> tuple
+enc_fused_site: Dict = {}                                     # zone -> tuple
+enc_fused_mix: Dict = {}                                      # (zone, overlay, watch) -> tuple; 50/50 zone/overlay mixture folded in
 
 # Calendar data (optional feature)
 calendar_file: str = ""                           # Path to calendar file (from datafile_file)
 calendar_data: Optional[Dict] = None              # Full calendar structure from YAML (includes current_date)
 calendar_month_lookup: Dict[str, int] = {}        # Month name -> 1-based index for quick lookups
+holiday_index: Dict = {}                          # (month name, day) -> holiday dict for O(1) lookups
+calendar_version: int = 0                         # Bumped on every calendar mutation; keys display caches in utils
+
+
+# Background data-load state (set by app startup; read by the page function)
+data_ready: bool = False                   # True once load_all_data has finished
+data_load_error: bool = False              # True if background loading failed
 
 
 # ============================================================================
@@ -88,8 +119,15 @@ generated_overland_rest_info: Optional[Dict] = None           # Rest information
 
 # Site mode state
 generated_site_time: int = 0                                  # Minutes elapsed
-generated_site_timers: List[Timer] = []                       # Active timers
-generated_site_encounters: Dict[str, Encounter] = {}          # Time slot -> Encounter mapping
+
+# Active timers as a heapq min-heap of (expires_at, insert order, Timer);
+# the counter keeps heap comparisons off the Timer objects themselves
+generated_site_timers: List[tuple] = []
+
+# Ring buffer of encounters, one per SITE_TIME_SLOTS slot in order
+# ("Current" first). Turn advance is popleft + append instead of
+# rebuilding a slot-keyed dict; index by SITE_SLOT_INDEX[label].
+generated_site_encounters: deque = deque((Encounter() for _ in range(6)), maxlen=6)
 
 
 # ============================================================================
@@ -115,3 +153,6 @@ SITE_TIME_SLOTS: List[str] = [
     "40 minutes",
     "50 minutes"
 ]
+
+# Slot label -> index into the generated_site_encounters ring buffer
+SITE_SLOT_INDEX: Dict[str, int] = {slot: i for i, slot in enumerate(SITE_TIME_SLOTS)}
@@ -12,19 +12,58 @@ Functions:
 - load_weather_by_season_excel() -> bool: Load weather weights by season from Excel
 - generate_encounter_by_zone_and_watch() -> xr.DataArray: Create 3D encounter array
 - validate_data() -> List[str]: Validate all loaded data for consistency
+- ensure_calendar_cache() -> None: Build derived calendar lookups if missing
 - save_calendar_date(month, day) -> bool: Save current date to calendar YAML
 - save_lunar_data(lunar_day, is_blood_moon) -> bool: Save lunar data to calendar YAML
+- save_calendar_state(month, day, lunar_day, is_blood_moon) -> bool: Save both in one pass
 
 Classes: None
 """
 
-from typing import List
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import hashlib
+import html
+import json
+import os
+import sys
 import yaml
-import pandas as pd
+try:
+    # libyaml-backed parser; several times faster than pure Python
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+import numpy as np
 import xarray as xr
+from openpyxl import load_workbook
+from ruamel.yaml import YAML
 import config
-from utils import parse_percentage, verbose_print
-from logger import log_info, log_error, log_warning
+from utils import build_alias, parse_percentages_bulk, verbose_print
+from logger import buffered_logging, log_info, log_error, log_warning
+
+# Lowercase watch keys as they appear in the encounters YAML, in watch order
+WATCH_KEYS = ("dawn", "morning", "afternoon", "dusk", "early night", "late night")
+
+# Round-trip YAML handler for targeted calendar-file edits; unlike
+# safe_load + dump it preserves comments, key order, and quoting
+_roundtrip_yaml = YAML()
+_roundtrip_yaml.preserve_quotes = True
+_calendar_doc = None  # Cached round-trip document for config.calendar_file
+
+
+def _current_date_sidecar_path() -> str:
+    """Path of the JSON sidecar holding the frequently-changing current date."""
+    return config.calendar_file + '.current_date.json'
+
+
+def _calendar_file_doc():
+    """Load (once) and return the round-trip document for the calendar file."""
+    global _calendar_doc
+    if _calendar_doc is None:
+        with open(config.calendar_file, 'r', encoding='utf-8') as f:
+            _calendar_doc = _roundtrip_yaml.load(f)
+    return _calendar_doc
 
 
 def load_all_data() -> bool:
@@ -36,77 +75,72 @@ def load_all_data() -> bool:
     
     Algorithm:
     1. Load datafile_file to get paths
-    2. Load zones_file
-    3. Load encounters_file
-    4. Load weathers_file
-    5. Load restinfo_file
-    6. Load encounter_by_zone_file (Excel)
-    7. Load weather_by_season_file (Excel)
-    8. Derive seasons_list
-    9. Generate encounter_by_zone_and_watch (3D array)
-    10. Validate all data
-    """
-    verbose_print("Loading all data files...")
-    
-    # Step 1: Load master config
-    if not load_datafile_config():
-        log_error("Failed to load master data file configuration")
-        return False
-    
-    # Step 2: Load zones (must be first to populate zone lists)
-    if not load_zones_file():
-        log_error("Failed to load zones file")
-        return False
-    
-    # Step 3: Load encounters
-    if not load_encounters_file():
-        log_error("Failed to load encounters file")
-        return False
-    
-    # Step 4: Load weathers
-    if not load_weathers_file():
-        log_error("Failed to load weathers file")
-        return False
-    
-    # Step 5: Load rest info
-    if not load_restinfo_file():
-        log_error("Failed to load rest info file")
-        return False
-    
-    # Step 6: Load encounter by zone (Excel)
-    if not load_encounter_by_zone_excel():
-        log_error("Failed to load encounter by zone Excel file")
-        return False
-    
-    # Step 7: Load weather by season (Excel)
-    if not load_weather_by_season_excel():
-        log_error("Failed to load weather by season Excel file")
-        return False
-    
-    # Step 8: Derive seasons list (already done in load_weather_by_season_excel)
-    
-    # Step 9: Generate 3D encounter array
-    verbose_print("Generating 3D encounter array...")
-    config.encounter_by_zone_and_watch = generate_encounter_by_zone_and_watch()
-    if config.encounter_by_zone_and_watch is None:
-        log_error("Failed to generate 3D encounter array")
-        return False
-    log_info(f"Generated 3D encounter array with shape: {config.encounter_by_zone_and_watch.shape}")
-    
-    # Step 10: Validate data
-    validation_errors = validate_data()
-    if validation_errors:
-        log_warning(f"Data validation found {len(validation_errors)} issues:")
-        for error in validation_errors:
-            log_warning(f"  - {error}")
-        # Don't fail on validation warnings, just log them
-
-    # Step 11: Load calendar (optional - always succeeds)
-    load_calendar_file()
-
-    log_info("All data files loaded successfully")
-    verbose_print("All data files loaded successfully")
-    return True
+    2. Load the individual data files concurrently (each loader writes a
+       distinct set of config attributes, so there are no shared writes):
+       zones, encounters, weathers, restinfo, both Excel files, calendar
+    3. Derive seasons_list (done inside load_weather_by_season_excel)
+    4. Generate encounter_by_zone_and_watch (3D array)
+    5. Validate all data
+    """
+    # Buffer log writes for the whole sequence: the loaders emit a couple
+    # dozen log_info calls, which become one disk flush at the end
+    with buffered_logging():
+        verbose_print("Loading all data files...")
+
+        # Step 1: Load master config (provides the paths for everything else)
+        if not load_datafile_config():
+            log_error("Failed to load master data file configuration")
+            return False
+
+        # Step 2: Load the independent files in a thread pool - YAML parsing
+        # (libyaml) and Excel reading spend most of their time in C code, so
+        # the loads overlap instead of running back to back
+        loaders = [
+            (load_zones_file, "zones file"),
+            (load_encounters_file, "encounters file"),
+            (load_weathers_file, "weathers file"),
+            (load_restinfo_file, "rest info file"),
+            (load_encounter_by_zone_excel, "encounter by zone Excel file"),
+            (load_weather_by_season_excel, "weather by season Excel file"),
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [(executor.submit(loader), description) for loader, description in loaders]
+            failed = False
+            for future, description in futures:
+                if not future.result():
+                    log_error(f"Failed to load {description}")
+                    failed = True
+        if failed:
+            return False
+
+        # Step 3: Derive seasons list (already done in load_weather_by_season_excel)
+
+        # Step 4: Generate 3D encounter array
+        verbose_print("Generating 3D encounter array...")
+        config.encounter_by_zone_and_watch = generate_encounter_by_zone_and_watch()
+        if config.encounter_by_zone_and_watch is None:
+            log_error("Failed to generate 3D encounter array")
+            return False
+        log_info(f"Generated 3D encounter array with shape: {config.encounter_by_zone_and_watch.shape}")
+
+        # Precompute the per-(zone, watch), per-zone, and per-season selection
+        # caches so generation never slices the arrays at click time
+        build_encounter_caches()
+
+        # Step 5: Validate data
+        validation_errors = validate_data()
+        if validation_errors:
+            log_warning(f"Data validation found {len(validation_errors)} issues:")
+            for error in validation_errors:
+                log_warning(f"  - {error}")
+            # Don't fail on validation warnings, just log them
+
+        # Step 6: Load calendar (optional - always succeeds)
+        load_calendar_file()
+
+        log_info("All data files loaded successfully")
+        verbose_print("All data files loaded successfully")
+        return True
 
 
 def load_datafile_config() -> bool:
@@ -119,7 +153,7 @@ def load_datafile_config() -> bool:
     try:
         verbose_print(f"Loading master config from {config.datafile_file}")
         with open(config.datafile_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         files = data.get('files', {})
         config.encounters_file = files.get('encounters_file', '')
@@ -148,7 +182,7 @@ def load_zones_file() -> bool:
     try:
         verbose_print(f"Loading zones from {config.zones_file}")
         with open(config.zones_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         zones = data.get('zones', [])
         config.zones_data = {}
@@ -156,22 +190,30 @@ def load_zones_file() -> bool:
         config.overland_overlay_list = []
         config.site_zones_list = []
         
-        for zone in zones:
+        # Each type name is tested once against a set instead of scanning
+        # the types list three times per zone
+        type_targets = {
+            'Overland': config.overland_zones_list,
+            'Overlay': config.overland_overlay_list,
+            'Site': config.site_zones_list,
+        }
+
+        # All encounter chances parsed in one vectorized pass
+        chances = parse_percentages_bulk([zone['encounter_chance'] for zone in zones])
+
+        for zone, chance_f in zip(zones, chances):
             name = zone['name']
             types = zone['types']
-            encounter_chance = zone['encounter_chance']
-            
+
             config.zones_data[name] = {
                 'types': types,
-                'encounter_chance': encounter_chance
+                'encounter_chance': zone['encounter_chance'],
+                # Parsed above so the per-watch rolls compare floats
+                'encounter_chance_f': float(chance_f)
             }
-            
-            if 'Overland' in types:
-                config.overland_zones_list.append(name)
-            if 'Overlay' in types:
-                config.overland_overlay_list.append(name)
-            if 'Site' in types:
-                config.site_zones_list.append(name)
+
+            for zone_type in set(types) & type_targets.keys():
+                type_targets[zone_type].append(name)
         
         log_info(f"Loaded {len(config.zones_data)} zones")
         log_info(f"  Overland zones: {len(config.overland_zones_list)}")
@@ -195,7 +237,7 @@ def load_encounters_file() -> bool:
     try:
         verbose_print(f"Loading encounters from {config.encounters_file}")
         with open(config.encounters_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         encounters = data.get('encounters', [])
         config.encounters_data = {}
@@ -205,8 +247,19 @@ def load_encounters_file() -> bool:
             config.encounters_data[name] = {
                 'description': encounter['description'],
                 'habitat': encounter['habitat'],
-                'sparks': encounter['sparks'],
-                'watch': encounter['watch']
+                # Frozen to a tuple: shared by reference with every Encounter
+                # instance, so it must be immutable
+                'sparks': tuple(encounter['sparks']),
+                'watch': encounter['watch'],
+                # Parsed once here so the 3D array build reads floats
+                'watch_pcts': parse_percentages_bulk(
+                    [encounter['watch'].get(key, '0%') for key in WATCH_KEYS]
+                ).astype(np.float32),
+                # Escaped once here so the render loop can emit raw HTML
+                # without re-escaping on every refresh
+                'name_html': html.escape(name),
+                'description_html': html.escape(encounter['description'] or ''),
+                'sparks_html': tuple(html.escape(spark) for spark in encounter['sparks'])
             }
         
         log_info(f"Loaded {len(config.encounters_data)} encounters")
@@ -228,7 +281,7 @@ def load_weathers_file() -> bool:
     try:
         verbose_print(f"Loading weathers from {config.weathers_file}")
         with open(config.weathers_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         weathers = data.get('weathers', [])
         config.weathers_data = {}
@@ -236,7 +289,8 @@ def load_weathers_file() -> bool:
         for weather in weathers:
             name = weather['name']
             config.weathers_data[name] = {
-                'effects': weather['effects']
+                # Frozen to a tuple: shared by reference with Weather instances
+                'effects': tuple(weather['effects'])
             }
         
         log_info(f"Loaded {len(config.weathers_data)} weather types")
@@ -258,10 +312,16 @@ def load_restinfo_file() -> bool:
     try:
         verbose_print(f"Loading rest info from {config.restinfo_file}")
         with open(config.restinfo_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         
         config.restinfo_data = data.get('rest_checks', {})
-        
+
+        # Reverse index so rest-info generation looks up the modifiers for
+        # each active weather effect instead of scanning the whole list
+        config.effect_to_modifiers = {}
+        for modifier in config.restinfo_data.get('weather_modifiers', []):
+            config.effect_to_modifiers.setdefault(modifier.get('effect'), []).append(modifier)
+
         log_info(f"Loaded rest information")
         
         return True
@@ -271,29 +331,64 @@ def load_restinfo_file() -> bool:
         return False
 
 
+def _read_numeric_sheet(path: str):
+    """
+    Read a 2D numeric Excel sheet with a header row and an index column.
+
+    Uses openpyxl in read-only/values-only mode, which skips the cell and
+    style objects pandas' default reader builds for the whole workbook.
+
+    Returns:
+        Tuple of (row labels, column labels, float32 ndarray); empty cells
+        become 0.
+    """
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        columns = [str(cell) for cell in next(rows)[1:]]
+        index = []
+        data_rows = []
+        for row in rows:
+            if row[0] is None:
+                continue
+            index.append(str(row[0]))
+            data_rows.append([float(cell) if cell is not None else 0.0 for cell in row[1:]])
+    finally:
+        workbook.close()
+
+    # float32 is the dtype for all weight matrices end-to-end: percentages
+    # don't need float64 range, and half the bytes means half the memory
+    # bandwidth for every downstream broadcast
+    values = np.array(data_rows, dtype=np.float32)
+    return index, columns, values
+
+
 def load_encounter_by_zone_excel() -> bool:
     """
     Load encounter weights by zone from Excel.
-    
+
     Returns:
         True if successful, False otherwise
     """
     try:
         verbose_print(f"Loading encounter by zone from {config.encounter_by_zone_file}")
-        
+
         # Read Excel file
-        df = pd.read_excel(config.encounter_by_zone_file, index_col=0)
-        
-        # Replace NaN with 0
-        df = df.fillna(0)
-        
-        # Convert to xarray
+        encounters, zones, values = _read_numeric_sheet(config.encounter_by_zone_file)
+
+        # Convert to xarray (kept for label-based consumers)
         config.encounter_by_zone = xr.DataArray(
-            df.values,
-            coords=[df.index, df.columns],
+            values,
+            coords=[encounters, zones],
             dims=['Encounter', 'Zone']
         )
-        
+
+        # Raw matrix + name->index dicts for hot paths; plain NumPy indexing
+        # is an order of magnitude faster than xarray .loc lookups
+        config.encounter_by_zone_values = values
+        config.encounter_row_idx = {name: i for i, name in enumerate(encounters)}
+        config.encounter_col_idx = {name: i for i, name in enumerate(zones)}
+
         log_info(f"Loaded encounter by zone: {config.encounter_by_zone.shape}")
         
         return True
@@ -312,23 +407,22 @@ def load_weather_by_season_excel() -> bool:
     """
     try:
         verbose_print(f"Loading weather by season from {config.weather_by_season_file}")
-        
+
         # Read Excel file
-        df = pd.read_excel(config.weather_by_season_file, index_col=0)
-        
-        # Replace NaN with 0
-        df = df.fillna(0)
-        
+        weathers, seasons, values = _read_numeric_sheet(config.weather_by_season_file)
+
         # Extract seasons list from column headers
-        config.seasons_list = list(df.columns)
+        config.seasons_list = seasons
+        config.seasons_set = frozenset(config.seasons_list)
         log_info(f"Extracted seasons: {config.seasons_list}")
-        
+
         # Convert to xarray
         config.weather_by_season = xr.DataArray(
-            df.values,
-            coords=[df.index, df.columns],
+            values,
+            coords=[weathers, seasons],
             dims=['Weather', 'Season']
         )
+        config.weather_labels = weathers
         
         log_info(f"Loaded weather by season: {config.weather_by_season.shape}")
         
@@ -339,59 +433,85 @@ def load_weather_by_season_excel() -> bool:
         return False
 
 
+def _encounter_3d_cache_path() -> Optional[Path]:
+    """Cache file path for the 3D encounter array, keyed by input file mtimes."""
+    try:
+        stamp = (f"{os.path.getmtime(config.encounter_by_zone_file)}|"
+                 f"{os.path.getmtime(config.encounters_file)}")
+    except OSError:
+        return None
+    key = hashlib.blake2b(stamp.encode()).hexdigest()[:16]
+    return Path("cache") / f"encounter_3d_{key}.npz"
+
+
 def generate_encounter_by_zone_and_watch() -> xr.DataArray:
     """
     Create 3D encounter array [Encounter, Zone, Watch] from 2D array and watch percentages.
-    
+
+    The result is cached on disk keyed by the mtimes of the two input files,
+    so unchanged data is reloaded with np.load instead of recomputed.
+
     Algorithm:
     1. Get list of watch periods
-    2. Create empty 3D array
-    3. For each encounter/zone/watch:
-       Calculate: zone_weight * watch_percentage
+    2. Build an [Encounter, Watch] matrix of watch percentages
+    3. Broadcast against the [Encounter, Zone] weights:
+       zone_weight * watch_percentage
     4. Return 3D xarray DataArray
-    
+
     Returns:
         3D xarray DataArray or None if error
     """
+    cache_path = _encounter_3d_cache_path()
+
+    # Reuse the cached tensor if the input files haven't changed
+    if cache_path is not None and cache_path.exists():
+        try:
+            cached = np.load(cache_path)
+            log_info(f"Loaded 3D encounter array from cache: {cache_path}")
+            return xr.DataArray(
+                cached['data'],
+                coords=[cached['encounters'].tolist(), cached['zones'].tolist(), cached['watches'].tolist()],
+                dims=['Encounter', 'Zone', 'Watch']
+            )
+        except Exception as e:
+            log_warning(f"Ignoring unreadable 3D encounter cache: {e}")
+
     try:
-        # Watch periods (map to lowercase keys in encounters data)
+        # Watch periods (display names; lowercase keys are in WATCH_KEYS)
         watches = ["Dawn", "Morning", "Afternoon", "Dusk", "Early Night", "Late Night"]
-        watch_keys = ["dawn", "morning", "afternoon", "dusk", "early night", "late night"]
-        
-        # Get dimensions
-        encounters = list(config.encounter_by_zone.coords['Encounter'].values)
-        zones = list(config.encounter_by_zone.coords['Zone'].values)
-        
-        # Create 3D array
-        data_3d = []
-        
-        for encounter in encounters:
-            encounter_data = []
-            for zone in zones:
-                zone_data = []
-                for i, watch in enumerate(watches):
-                    # Get zone weight
-                    zone_weight = float(config.encounter_by_zone.loc[encounter, zone])
-                    
-                    # Get watch percentage
-                    watch_key = watch_keys[i]
-                    watch_pct_str = config.encounters_data[encounter]['watch'].get(watch_key, '0%')
-                    watch_percentage = parse_percentage(watch_pct_str)
-                    
-                    # Calculate final weight
-                    final_weight = zone_weight * watch_percentage
-                    zone_data.append(final_weight)
-                
-                encounter_data.append(zone_data)
-            data_3d.append(encounter_data)
-        
+
+        # Get dimensions (the index dicts preserve the matrix row/col order)
+        encounters = list(config.encounter_row_idx)
+        zones = list(config.encounter_col_idx)
+
+        # Watch percentages as an (E, 6) matrix, parsed at encounter load
+        pcts = np.stack([config.encounters_data[encounter]['watch_pcts'] for encounter in encounters])
+
+        # Broadcast zone weights (E, Z) against watch percentages (E, 6)
+        # into the full (E, Z, 6) tensor with a single NumPy multiply
+        # instead of one .loc lookup and string parse per cell
+        data_3d = config.encounter_by_zone_values[:, :, None] * pcts[:, None, :]
+
         # Create xarray
         array_3d = xr.DataArray(
             data_3d,
             coords=[encounters, zones, watches],
             dims=['Encounter', 'Zone', 'Watch']
         )
-        
+
+        # Save for future launches, dropping caches keyed to older inputs
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(exist_ok=True)
+                for stale in cache_path.parent.glob('encounter_3d_*.npz'):
+                    stale.unlink()
+                np.savez(cache_path, data=data_3d,
+                         encounters=np.array(encounters),
+                         zones=np.array(zones),
+                         watches=np.array(watches))
+            except Exception as e:
+                log_warning(f"Could not write 3D encounter cache: {e}")
+
         return array_3d
         
     except Exception as e:
@@ -399,6 +519,141 @@ def generate_encounter_by_zone_and_watch() -> xr.DataArray:
         return None
 
 
+def _selection_entry(names: np.ndarray, weights: np.ndarray) -> tuple:
+    """Filter zero weights and attach a Vose alias table; see build_encounter_caches."""
+    mask = weights > 0
+    names = names[mask]
+    weights = weights[mask]
+    if len(names):
+        prob, alias = build_alias(weights)
+    else:
+        prob = alias = None
+    return names, weights, prob, alias
+
+
+def _fused_entry(entry: tuple, chance: float) -> tuple:
+    """
+    Extend a selection entry with a fused occurrence + selection CDF.
+
+    Each encounter's cumulative weight is scaled by the zone's encounter
+    chance and a final slot worth the remaining mass means "no encounter",
+    so one uniform draw in [0, total) decides both whether an encounter
+    occurs and which one it is.
+    """
+    names, weights, _prob, _alias = entry
+    total = float(weights.sum()) if len(weights) else 0.0
+    if total <= 0:
+        return names, weights, None, 0.0
+    cum_ext = np.concatenate([np.cumsum(weights, dtype=np.float64) * chance, [total]])
+    return names, weights, cum_ext, total
+
+
+def _mixture_entry(entry_a: tuple, chance_a: float, entry_b: tuple, chance_b: float) -> tuple:
+    """
+    Fuse a 50/50 zone/overlay mixture into a single extended CDF.
+
+    Each side contributes half its fused distribution: encounter i gets
+    mass 0.5 * chance * weight_i / total over the union of names, and the
+    leftover mass up to 1.0 is the "no encounter" slot. One uniform draw
+    then replaces the active-zone coin, the occurrence roll and the
+    selection for a fixed (zone, overlay) pair.
+    """
+    mass: Dict[str, float] = {}
+    for (names, weights, _cum_ext, total), chance in ((entry_a, chance_a), (entry_b, chance_b)):
+        if total <= 0 or chance <= 0:
+            continue
+        scale = 0.5 * chance / total
+        for name, weight in zip(names, weights):
+            mass[str(name)] = mass.get(str(name), 0.0) + float(weight) * scale
+    if not mass:
+        return np.array([], dtype=str), np.array([], dtype=np.float64), None, 0.0
+    mix_names = np.array(list(mass))
+    mix_weights = np.array(list(mass.values()), dtype=np.float64)
+    cum_ext = np.concatenate([np.cumsum(mix_weights), [1.0]])
+    return mix_names, mix_weights, cum_ext, 1.0
+
+
+def build_encounter_caches() -> None:
+    """
+    Precompute weighted-selection caches for encounter and weather generation.
+
+    Slicing the arrays per generation costs more than the selection itself,
+    so after the 3D array is assembled this builds, for every (zone, watch)
+    pair, every zone, and every season, a (names, weights, prob, alias)
+    tuple with zero-weight entries already filtered out and a Walker/Vose
+    alias table attached. Generation then reduces to one dict lookup and an
+    O(1) alias draw (one uniform plus one coin flip, no allocations).
+    """
+    config.enc_weights = {}
+    config.enc_weights_site = {}
+    config.weather_weights = {}
+    config.enc_fused = {}
+    config.enc_fused_site = {}
+    config.enc_fused_mix = {}
+
+    names = np.array(list(config.encounter_row_idx))
+    data_3d = config.encounter_by_zone_and_watch.values
+    watches = [str(watch) for watch in config.encounter_by_zone_and_watch.coords['Watch'].values]
+
+    for zone, col in config.encounter_col_idx.items():
+        zone_info = config.zones_data.get(zone)
+        chance = zone_info['encounter_chance_f'] if zone_info else 0.0
+
+        # Site generation draws from the raw 2D zone weights
+        entry = _selection_entry(names, config.encounter_by_zone_values[:, col])
+        config.enc_weights_site[zone] = entry
+        config.enc_fused_site[zone] = _fused_entry(entry, chance)
+
+        # Overland generation draws from the watch-scaled 3D weights
+        for watch_idx, watch in enumerate(watches):
+            entry = _selection_entry(names, data_3d[:, col, watch_idx])
+            config.enc_weights[(zone, watch)] = entry
+            config.enc_fused[(zone, watch)] = _fused_entry(entry, chance)
+
+    # Overlay mixtures: for a fixed (zone, overlay) pair the 50/50
+    # active-zone coin and both fused draws collapse into one CDF, so the
+    # overlay case is a single uniform draw per watch as well
+    def _chance(z: str) -> float:
+        info = config.zones_data.get(z)
+        return info['encounter_chance_f'] if info else 0.0
+
+    for zone in config.overland_zones_list:
+        for overlay in config.overland_overlay_list:
+            for watch in watches:
+                entry_a = config.enc_fused.get((zone, watch))
+                entry_b = config.enc_fused.get((overlay, watch))
+                if entry_a is None or entry_b is None:
+                    # Zone listed in zones.yaml but absent from the Excel
+                    # matrix: leave the mix entry unset so draws fall back
+                    # to the per-call path and degrade to "no encounter"
+                    continue
+                config.enc_fused_mix[(zone, overlay, watch)] = _mixture_entry(
+                    entry_a, _chance(zone),
+                    entry_b, _chance(overlay)
+                )
+
+    # Weather draws from the static per-season columns
+    config.weather_weights_no_nc = {}
+    weather_names = np.array(config.weather_labels)
+    weather_values = config.weather_by_season.values
+    for season_idx, season in enumerate(config.seasons_list):
+        entry = _selection_entry(weather_names, weather_values[:, season_idx])
+        config.weather_weights[season] = entry
+
+        # Day-1 variant: "No Change" removed (there is no previous weather
+        # to keep) and a plain cumulative sum for a single searchsorted draw
+        names_f, weights_f, _prob, _alias = entry
+        mask = names_f != "No Change"
+        day1_weights = weights_f[mask]
+        cumulative = np.cumsum(day1_weights, dtype=np.float64)
+        config.weather_weights_no_nc[season] = (
+            names_f[mask], day1_weights, cumulative,
+            float(cumulative[-1]) if len(cumulative) else 0.0
+        )
+
+    log_info(f"Built selection caches: {len(config.enc_weights_site)} zones, {len(config.weather_weights)} seasons")
+
+
 def validate_data() -> List[str]:
     """
     Validate all loaded data for consistency and completeness.
@@ -408,25 +663,32 @@ def validate_data() -> List[str]:
     """
     errors = []
 
+    # Bind the config attributes once; module-attribute resolution per
+    # iteration adds up on the element-wise checks below
+    encounters_data = config.encounters_data
+    zones_data = config.zones_data
+    weathers_data = config.weathers_data
+
     # Check encounters referenced in encounter_by_zone exist in encounters_data
-    for encounter in config.encounter_by_zone.coords['Encounter'].values:
-        if encounter not in config.encounters_data:
+    for encounter in config.encounter_row_idx:
+        if encounter not in encounters_data:
             errors.append(f"Encounter '{encounter}' in encounter_by_zone not found in encounters_data")
 
     # Check zones referenced in encounter_by_zone exist in zones_data
-    for zone in config.encounter_by_zone.coords['Zone'].values:
-        if zone not in config.zones_data:
+    for zone in config.encounter_col_idx:
+        if zone not in zones_data:
             errors.append(f"Zone '{zone}' in encounter_by_zone not found in zones_data")
 
-    # Check weather types exist (except "No Change")
-    for weather in config.weather_by_season.coords['Weather'].values:
-        if weather != "No Change" and weather not in config.weathers_data:
+    # Check weather types exist (except "No Change"); the plain label list
+    # avoids materializing the xarray coordinate array at all
+    for weather in config.weather_labels:
+        if weather != "No Change" and weather not in weathers_data:
             errors.append(f"Weather '{weather}' in weather_by_season not found in weathers_data")
 
     # Check seasons in rest_DCs match seasons_list
     rest_dcs = config.restinfo_data.get('rest_DCs', {})
     for season in rest_dcs.keys():
-        if season not in config.seasons_list:
+        if season not in config.seasons_set:
             errors.append(f"Season '{season}' in rest_DCs not found in seasons_list")
 
     return errors
@@ -444,8 +706,11 @@ def load_calendar_file() -> bool:
         True always (calendar is optional, missing file is not an error)
     """
     # Reset calendar data
+    global _calendar_doc
+    _calendar_doc = None
     config.calendar_data = None
     config.calendar_month_lookup = {}
+    config.calendar_version += 1
 
     # Check if calendar file path is configured
     if not config.calendar_file:
@@ -457,7 +722,7 @@ def load_calendar_file() -> bool:
         verbose_print(f"Loading calendar from {config.calendar_file}")
 
         with open(config.calendar_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
 
         # Check if file is blank or has no calendar data
         if not data or 'calendar' not in data:
@@ -477,12 +742,49 @@ def load_calendar_file() -> bool:
         # Calendar is valid - store it
         config.calendar_data = calendar
 
+        # Overlay the current-date sidecar, which supersedes the date in the
+        # YAML (see save_calendar_date)
+        try:
+            with open(_current_date_sidecar_path(), 'r', encoding='utf-8') as f:
+                calendar['current_date'] = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log_warning(f"Ignoring unreadable current-date sidecar: {e}")
+
+        # Establish the 1 <= month <= len(months) invariant here, at the
+        # only point untrusted dates enter (YAML or hand-edited sidecar);
+        # the read-side getters index months without re-checking bounds
+        current_date = calendar.get('current_date')
+        if current_date:
+            month = current_date.get('month')
+            if not isinstance(month, int) or month < 1 or month > len(months):
+                log_warning(f"Discarding out-of-range current date (month {month!r})")
+                calendar['current_date'] = None
+
+        # Intern the month name/season strings: getters hand these out on
+        # every UI refresh and downstream == comparisons (season checks,
+        # holiday keys) then short-circuit on identity
+        for month in months:
+            if 'name' in month:
+                month['name'] = sys.intern(month['name'])
+            if 'season' in month:
+                month['season'] = sys.intern(month['season'])
+
+        # Precompute derived lookups used on every calendar render
+        ensure_calendar_cache()
+
         # Build month lookup dictionary (name -> 1-based index)
-        config.calendar_month_lookup = {}
-        for i, month in enumerate(months, 1):
-            month_name = month.get('name', '')
-            if month_name:
-                config.calendar_month_lookup[month_name] = i
+        config.calendar_month_lookup = {
+            name: i for i, month in enumerate(months, 1) if (name := month.get('name'))
+        }
+
+        # Build holiday lookup ((month name, day) -> holiday); holidays are
+        # static, so the per-date scan becomes a single dict get
+        config.holiday_index = {
+            (holiday.get('month'), holiday.get('day')): holiday
+            for holiday in calendar.get('holidays', [])
+        }
 
         # Log success
         num_months = len(months)
@@ -511,6 +813,53 @@ def load_calendar_file() -> bool:
         return True
 
 
+def ensure_calendar_cache() -> None:
+    """
+    Build derived calendar lookups cached on config.calendar_data.
+
+    The calendar structure only changes when the file is reloaded, so the
+    holiday lookup and month metadata are computed once and stored under
+    underscore-prefixed keys (these never get written back to the YAML file).
+    Call again after setting '_holiday_lookup' to None to force a rebuild.
+    """
+    calendar = config.calendar_data
+    if calendar is None:
+        return
+
+    if calendar.get('_holiday_lookup') is not None:
+        return  # Cache already built
+
+    # Holiday lookup: (month_idx, day) -> holiday. Integer-keyed tuples hash
+    # faster than month-name strings in the per-day render loop.
+    holidays = calendar.get('holidays', [])
+    month_indices = {
+        month.get('name'): idx
+        for idx, month in enumerate(calendar.get('months', []), 1)
+    }
+    for holiday in holidays:
+        holiday['_name_html'] = html.escape(holiday.get('name', ''))
+        holiday['_description_html'] = html.escape(holiday.get('description', ''))
+    calendar['_holiday_lookup'] = {
+        (month_indices[holiday.get('month')], holiday.get('day')): holiday
+        for holiday in holidays
+        if holiday.get('month') in month_indices
+    }
+
+    # Month metadata read on every render
+    calendar['_months'] = calendar.get('months', [])
+    calendar['_days_per_week'] = calendar.get('days_per_week', 6)
+
+    # Month lengths and their prefix sums: date advancement jumps straight
+    # to the target month with modulo + searchsorted instead of looping
+    # month by month
+    month_days = np.array(
+        [month.get('days', 30) for month in calendar['_months']], dtype=np.int32
+    )
+    calendar['_month_days'] = month_days
+    calendar['_cum_days'] = np.cumsum(month_days)
+    calendar['_year_length'] = int(calendar['_cum_days'][-1]) if len(month_days) else 0
+
+
 def save_calendar_date(month: int, day: int) -> bool:
     """
     Save current date to the calendar YAML file.
@@ -529,29 +878,33 @@ def save_calendar_date(month: int, day: int) -> bool:
         log_warning("Cannot save calendar date - no calendar loaded")
         return False
 
+    # Day clicks arrive as client-posted events, so enforce the
+    # 1 <= month <= len(months) invariant the read path relies on at this
+    # mutation point rather than trusting the caller
+    months = config.calendar_data.get('months', [])
+    if month < 1 or month > len(months):
+        log_error(f"Rejecting out-of-range calendar date: month {month}")
+        return False
+    if day < 1 or day > months[month - 1].get('days', 30):
+        log_error(f"Rejecting out-of-range calendar date: month {month}, day {day}")
+        return False
+
     try:
         # Update in-memory calendar data
         config.calendar_data['current_date'] = {
             'month': month,
             'day': day
         }
+        config.calendar_version += 1
 
-        # Read the full file to preserve structure and comments
-        with open(config.calendar_file, 'r', encoding='utf-8') as f:
-            file_data = yaml.safe_load(f)
-
-        # Update current_date in file data
-        file_data['calendar']['current_date'] = {
-            'month': month,
-            'day': day
-        }
-
-        # Write back to file
-        with open(config.calendar_file, 'w', encoding='utf-8') as f:
-            yaml.dump(file_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+        # The date ticks on every New Day, so it persists as a tiny JSON
+        # sidecar; the calendar YAML itself is never rewritten for a date
+        # change (load_calendar_file overlays the sidecar on load)
+        with open(_current_date_sidecar_path(), 'w', encoding='utf-8') as f:
+            json.dump({'month': month, 'day': day}, f)
 
         log_info(f"Saved calendar date: month {month}, day {day}")
-        verbose_print(f"Calendar date saved: month {month}, day {day}")
+        verbose_print("Calendar date saved: month {}, day {}", month, day)
 
         return True
 
@@ -582,24 +935,76 @@ def save_lunar_data(lunar_day: int, is_blood_moon: bool) -> bool:
         # Update in-memory calendar data
         config.calendar_data['lunar_day'] = lunar_day
         config.calendar_data['is_blood_moon'] = is_blood_moon
+        config.calendar_version += 1
 
-        # Read the full file to preserve structure and comments
-        with open(config.calendar_file, 'r', encoding='utf-8') as f:
-            file_data = yaml.safe_load(f)
-
-        # Update lunar data in file data
+        # Targeted edit of the cached round-trip document (see save_calendar_date)
+        file_data = _calendar_file_doc()
         file_data['calendar']['lunar_day'] = lunar_day
         file_data['calendar']['is_blood_moon'] = is_blood_moon
 
         # Write back to file
         with open(config.calendar_file, 'w', encoding='utf-8') as f:
-            yaml.dump(file_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+            _roundtrip_yaml.dump(file_data, f)
 
         log_info(f"Saved lunar data: day {lunar_day}, blood_moon {is_blood_moon}")
-        verbose_print(f"Lunar data saved: day {lunar_day}, blood_moon {is_blood_moon}")
+        verbose_print("Lunar data saved: day {}, blood_moon {}", lunar_day, is_blood_moon)
 
         return True
 
     except Exception as e:
         log_error(f"Error saving lunar data: {e}")
         return False
+
+
+def save_calendar_state(month: int, day: int, lunar_day: int, is_blood_moon: bool) -> bool:
+    """
+    Save the calendar date and lunar data together.
+
+    Used by the combined day-advance path (utils.advance_time) so a game
+    tick bumps calendar_version once and touches each file once instead of
+    going through save_calendar_date and save_lunar_data separately.
+
+    Args:
+        month: 1-based month index (1 to number of months)
+        day: 1-based day of month (1 to days in that month)
+        lunar_day: Current day in lunar cycle (1 to lunar_cycle_length)
+        is_blood_moon: Whether current full moon is a blood moon
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not config.calendar_file or not config.calendar_data:
+        log_warning("Cannot save calendar state - no calendar loaded")
+        return False
+
+    try:
+        # Update in-memory calendar data with a single version bump
+        config.calendar_data['current_date'] = {
+            'month': month,
+            'day': day
+        }
+        config.calendar_data['lunar_day'] = lunar_day
+        config.calendar_data['is_blood_moon'] = is_blood_moon
+        config.calendar_version += 1
+
+        # Date goes to the JSON sidecar (see save_calendar_date)
+        with open(_current_date_sidecar_path(), 'w', encoding='utf-8') as f:
+            json.dump({'month': month, 'day': day}, f)
+
+        # Lunar data goes to the calendar YAML (see save_lunar_data)
+        file_data = _calendar_file_doc()
+        file_data['calendar']['lunar_day'] = lunar_day
+        file_data['calendar']['is_blood_moon'] = is_blood_moon
+
+        with open(config.calendar_file, 'w', encoding='utf-8') as f:
+            _roundtrip_yaml.dump(file_data, f)
+
+        log_info(f"Saved calendar state: month {month}, day {day}, "
+                 f"lunar day {lunar_day}, blood_moon {is_blood_moon}")
+        verbose_print("Calendar state saved: month {}, day {}, lunar day {}", month, day, lunar_day)
+
+        return True
+
+    except Exception as e:
+        log_error(f"Error saving calendar state: {e}")
+        return False
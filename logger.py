@@ -13,41 +13,70 @@ Classes: None
 
 import logging
 import os
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 
 def setup_logging() -> None:
     r"""
     Initialize logging configuration.
-    
+
     Creates logs directory if it doesn't exist and configures logging to:
     - Write to \logs\TCControlPanel.log
     - Use UTF-8 encoding
-    - Append to existing log file
+    - Rotate at ~5 MB, keeping 3 backups (so the log never grows unbounded)
     - Format: timestamp - level - message
+
+    Safe to call more than once; the handler is only installed the first time.
     """
     # Create logs directory if it doesn't exist
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
-    
+
     # Configure logging
     log_file = logs_dir / "TCControlPanel.log"
-    
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8', mode='a')
-        ]
-    )
-    
+
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    if not root.handlers:
+        handler = RotatingFileHandler(log_file, maxBytes=5_000_000, backupCount=3, encoding='utf-8')
+        handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        ))
+        root.addHandler(handler)
+
     # Log startup
     logging.info("="*60)
     logging.info("Torchcrawl GM Control Panel - Application Started")
     logging.info("="*60)
 
 
+@contextmanager
+def buffered_logging(capacity: int = 200):
+    """
+    Buffer log records in memory for the duration of the block.
+
+    Records are written to the real handlers in one flush on exit (or
+    immediately if an ERROR is logged), turning bursts of log calls into a
+    single disk write.
+    """
+    root = logging.getLogger()
+    original_handlers = root.handlers[:]
+    buffers = [
+        MemoryHandler(capacity, flushLevel=logging.ERROR, target=handler)
+        for handler in original_handlers
+    ]
+    root.handlers = buffers
+    try:
+        yield
+    finally:
+        root.handlers = original_handlers
+        for buffer in buffers:
+            buffer.close()  # flushes remaining records to the target
+
+
 def log_debug(message: str) -> None:
     """
     Log debug message.
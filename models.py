@@ -9,22 +9,63 @@ Classes:
 Functions: None
 """
 
-from typing import Optional, List, Dict
+from typing import Optional, Dict, Sequence
+import html
 import random
+import numpy as np
 import xarray as xr
+from logger import log_info
+from utils import alias_sample, build_alias, verbose_print
+
+# config imports this module at its own top level, so it stays a lazy
+# in-method import here to avoid the circular dependency
 
 
 class Encounter:
     """Represents a single encounter occurrence."""
-    
+
+    # Slots instead of a per-instance __dict__: fixed-offset attribute access
+    # and a fraction of the memory for the dozen instances alive per day
+    __slots__ = ('name', 'time', 'sparks', 'description', 'habitat',
+                 'name_html', 'sparks_html', 'description_html')
+
+    # Shared empty sparks for cleared instances (immutable, safe to share)
+    _NO_SPARKS = ()
+
     def __init__(self) -> None:
         """Initialize an empty encounter (represents 'no encounter')."""
+        self._clear()
+
+    def _clear(self) -> None:
+        """Reset all fields to the 'no encounter' state."""
         self.name: Optional[str] = None
         self.time: Optional[str] = None
-        self.sparks: List[str] = []
+        self.sparks = Encounter._NO_SPARKS
         self.description: Optional[str] = None
         self.habitat: Optional[str] = None
-    
+        # Pre-escaped copies for direct ui.html rendering (escaped at load)
+        self.name_html: Optional[str] = None
+        self.sparks_html = Encounter._NO_SPARKS
+        self.description_html: str = ''
+
+    def populate(self, name: str, time_label: str, encounter_details: Dict) -> None:
+        """
+        Fill in this encounter from a selected name and its loaded details.
+
+        Args:
+            name: Selected encounter name
+            time_label: Watch period or time slot label
+            encounter_details: Entry from encounters_data for this encounter
+        """
+        self.name = name
+        self.time = time_label
+        self.sparks = encounter_details['sparks']  # ALL sparks
+        self.description = encounter_details['description']
+        self.habitat = encounter_details['habitat']
+        self.name_html = encounter_details['name_html']
+        self.sparks_html = encounter_details['sparks_html']
+        self.description_html = encounter_details['description_html']
+
     def generate_overland_encounter(
         self,
         zone: str,
@@ -38,11 +79,11 @@ class Encounter:
         Generate an overland encounter for a specific watch period.
         
         Algorithm:
-        1. Determine active zone (50% chance overlay if provided)
-        2. Get encounter_chance for active zone
-        3. Roll to see if encounter occurs
-        4. If encounter occurs, select based on weighted probabilities
-        5. Populate encounter details
+        1. Determine active zone (with an overlay, the precomputed
+           zone/overlay mixture CDF absorbs the 50/50 coin)
+        2. Draw one uniform against the fused CDF, which decides both
+           whether an encounter occurs and which one it is
+        3. Populate encounter details (or clear on the no-encounter slot)
         
         Args:
             zone: Base overland zone
@@ -52,78 +93,87 @@ class Encounter:
             encounter_by_zone_and_watch: 3D xarray [Encounter, Zone, Watch]
             zones_data: Dictionary of zone information
         """
-        from utils import weighted_random_choice, parse_percentage, verbose_print
-        from logger import log_info
-        
-        # Step 1: Determine active zone (50/50 if overlay present)
+        import config
+
+        # Step 1: Determine active zone. With an overlay, the precomputed
+        # mixture CDF (config.enc_fused_mix) folds the 50/50 coin into the
+        # draw itself; the coin flip only remains as a fallback
         active_zone = zone
+        fused = None
         if overlay is not None:
-            if random.random() < 0.5:
+            fused = config.enc_fused_mix.get((zone, overlay, watch))
+            if fused is not None:
+                active_zone = f"{zone}/{overlay}"
+                verbose_print("  Using zone/overlay mixture: {}", active_zone)
+            elif random.random() < 0.5:
                 active_zone = overlay
-                verbose_print(f"  Using overlay zone: {overlay}")
+                verbose_print("  Using overlay zone: {}", overlay)
             else:
-                verbose_print(f"  Using base zone: {zone}")
-        
-        # Step 2: Get encounter chance
-        encounter_chance = parse_percentage(zones_data[active_zone]['encounter_chance'])
-        
-        # Step 3: Roll for encounter
-        roll = random.random()
-        verbose_print(f"  Encounter roll: {roll:.2f} vs threshold {encounter_chance:.2f}")
-        
-        if roll > encounter_chance:
-            # No encounter
-            self.name = None
-            self.time = None
-            self.sparks = []
-            self.description = None
-            self.habitat = None
-            log_info(f"{watch} encounter: No encounter (rolled {roll:.2f} > {encounter_chance:.2f})")
-            verbose_print(f"  Result: No encounter")
-            return
-        
-        # Step 4-5: Select and populate encounter
+                verbose_print("  Using base zone: {}", zone)
+
+        # Steps 2-5: One fused uniform draw decides both whether an
+        # encounter occurs and which one (see config.enc_fused); falls back
+        # to a separate chance roll plus alias draw if the caches are absent
         try:
-            # Get weights for this zone and watch
-            weights = {}
-            for encounter_name in encounter_by_zone_and_watch.coords['Encounter'].values:
-                weight = float(encounter_by_zone_and_watch.loc[encounter_name, active_zone, watch])
-                if weight > 0:
-                    weights[encounter_name] = weight
-            
-            if not weights:
-                # No valid encounters for this zone/watch
-                self.name = None
-                self.time = None
-                self.sparks = []
-                self.description = None
-                self.habitat = None
-                log_info(f"{watch} encounter: No valid encounters for {active_zone}/{watch}")
-                return
-            
-            # Select encounter
-            selected_encounter = weighted_random_choice(weights)
-            
+            if fused is None:
+                fused = config.enc_fused.get((active_zone, watch))
+            if fused is not None:
+                names, weights_arr, cum_ext, total = fused
+
+                if len(names) == 0:
+                    # No valid encounters for this zone/watch
+                    self._clear()
+                    log_info(f"{watch} encounter: No valid encounters for {active_zone}/{watch}")
+                    return
+
+                u = random.random() * total
+                idx = int(np.searchsorted(cum_ext, u))
+                verbose_print("  Fused draw: {:.2f} of {:.2f}", u, total)
+                if idx >= len(names):
+                    # Landed in the "no encounter" slot
+                    self._clear()
+                    log_info(f"{watch} encounter: No encounter")
+                    verbose_print("  Result: No encounter")
+                    return
+            else:
+                encounter_chance = zones_data[active_zone]['encounter_chance_f']
+                roll = random.random()
+                verbose_print("  Encounter roll: {:.2f} vs threshold {:.2f}", roll, encounter_chance)
+
+                if roll > encounter_chance:
+                    self._clear()
+                    log_info(f"{watch} encounter: No encounter (rolled {roll:.2f} > {encounter_chance:.2f})")
+                    verbose_print("  Result: No encounter")
+                    return
+
+                names = encounter_by_zone_and_watch.coords['Encounter'].values
+                weights_arr = encounter_by_zone_and_watch.sel(Zone=active_zone, Watch=watch).values
+                mask = weights_arr > 0
+                names = names[mask]
+                weights_arr = weights_arr[mask]
+
+                if len(names) == 0:
+                    self._clear()
+                    log_info(f"{watch} encounter: No valid encounters for {active_zone}/{watch}")
+                    return
+
+                prob, alias = build_alias(weights_arr)
+                idx = alias_sample(prob, alias)
+
+            selected_encounter = str(names[idx])
+            selected_weight = float(weights_arr[idx])
+
             # Populate encounter details
-            encounter_details = encounters_data[selected_encounter]
-            self.name = selected_encounter
-            self.time = watch
-            self.sparks = encounter_details['sparks']  # ALL sparks
-            self.description = encounter_details['description']
-            self.habitat = encounter_details['habitat']
-            
-            log_info(f"{watch} encounter: {selected_encounter} (zone: {active_zone}, weight: {weights[selected_encounter]:.2f})")
-            verbose_print(f"  Result: {selected_encounter}")
-            
+            self.populate(selected_encounter, watch, encounters_data[selected_encounter])
+
+            log_info(f"{watch} encounter: {selected_encounter} (zone: {active_zone}, weight: {selected_weight:.2f})")
+            verbose_print("  Result: {}", selected_encounter)
+
         except Exception as e:
             log_info(f"Error generating overland encounter: {e}")
-            verbose_print(f"  Error: {e}")
+            verbose_print("  Error: {}", e)
             # Set to no encounter on error
-            self.name = None
-            self.time = None
-            self.sparks = []
-            self.description = None
-            self.habitat = None
+            self._clear()
     
     def generate_site_encounter(
         self,
@@ -137,11 +187,10 @@ class Encounter:
         Generate a site-based encounter for a specific time slot.
         
         Algorithm:
-        1. Get encounter_chance for zone
-        2. Roll to see if encounter occurs
-        3. If encounter occurs, select based on zone weights (no watch modifier)
-        4. Populate encounter details
-        
+        1. Draw one uniform against the zone's fused CDF, which decides
+           both whether an encounter occurs and which one (no watch modifier)
+        2. Populate encounter details (or clear on the no-encounter slot)
+
         Args:
             zone: Site zone
             time_slot: Time slot label
@@ -149,69 +198,70 @@ class Encounter:
             encounter_by_zone: 2D xarray [Encounter, Zone]
             zones_data: Dictionary of zone information
         """
-        from utils import weighted_random_choice, parse_percentage, verbose_print
-        from logger import log_info
-        
-        # Step 1: Get encounter chance
-        encounter_chance = parse_percentage(zones_data[zone]['encounter_chance'])
-        
-        # Step 2: Roll for encounter
-        roll = random.random()
-        verbose_print(f"  Encounter roll for {time_slot}: {roll:.2f} vs threshold {encounter_chance:.2f}")
-        
-        if roll > encounter_chance:
-            # No encounter
-            self.name = None
-            self.time = None
-            self.sparks = []
-            self.description = None
-            self.habitat = None
-            log_info(f"{time_slot} encounter: No encounter (rolled {roll:.2f} > {encounter_chance:.2f})")
-            verbose_print(f"  Result: No encounter")
-            return
-        
-        # Step 3-4: Select and populate encounter
+        import config
+
+        # Steps 1-2: One fused uniform draw decides both whether an
+        # encounter occurs and which one (see config.enc_fused_site); falls
+        # back to a separate chance roll plus alias draw without the caches
         try:
-            # Get weights for this zone (no watch modifier for site encounters)
-            weights = {}
-            for encounter_name in encounter_by_zone.coords['Encounter'].values:
-                weight = float(encounter_by_zone.loc[encounter_name, zone])
-                if weight > 0:
-                    weights[encounter_name] = weight
-            
-            if not weights:
-                # No valid encounters for this zone
-                self.name = None
-                self.time = None
-                self.sparks = []
-                self.description = None
-                self.habitat = None
-                log_info(f"{time_slot} encounter: No valid encounters for {zone}")
-                return
-            
-            # Select encounter
-            selected_encounter = weighted_random_choice(weights)
-            
+            fused = config.enc_fused_site.get(zone)
+            if fused is not None:
+                names, weights_arr, cum_ext, total = fused
+
+                if len(names) == 0:
+                    # No valid encounters for this zone
+                    self._clear()
+                    log_info(f"{time_slot} encounter: No valid encounters for {zone}")
+                    return
+
+                u = random.random() * total
+                idx = int(np.searchsorted(cum_ext, u))
+                verbose_print("  Fused draw for {}: {:.2f} of {:.2f}", time_slot, u, total)
+                if idx >= len(names):
+                    # Landed in the "no encounter" slot
+                    self._clear()
+                    log_info(f"{time_slot} encounter: No encounter")
+                    verbose_print("  Result: No encounter")
+                    return
+            else:
+                encounter_chance = zones_data[zone]['encounter_chance_f']
+                roll = random.random()
+                verbose_print("  Encounter roll for {}: {:.2f} vs threshold {:.2f}", time_slot, roll, encounter_chance)
+
+                if roll > encounter_chance:
+                    self._clear()
+                    log_info(f"{time_slot} encounter: No encounter (rolled {roll:.2f} > {encounter_chance:.2f})")
+                    verbose_print("  Result: No encounter")
+                    return
+
+                names = encounter_by_zone.coords['Encounter'].values
+                weights_arr = encounter_by_zone.sel(Zone=zone).values
+                mask = weights_arr > 0
+                names = names[mask]
+                weights_arr = weights_arr[mask]
+
+                if len(names) == 0:
+                    self._clear()
+                    log_info(f"{time_slot} encounter: No valid encounters for {zone}")
+                    return
+
+                prob, alias = build_alias(weights_arr)
+                idx = alias_sample(prob, alias)
+
+            selected_encounter = str(names[idx])
+            selected_weight = float(weights_arr[idx])
+
             # Populate encounter details
-            encounter_details = encounters_data[selected_encounter]
-            self.name = selected_encounter
-            self.time = time_slot
-            self.sparks = encounter_details['sparks']  # ALL sparks
-            self.description = encounter_details['description']
-            self.habitat = encounter_details['habitat']
-            
-            log_info(f"{time_slot} encounter: {selected_encounter} (zone: {zone}, weight: {weights[selected_encounter]:.2f})")
-            verbose_print(f"  Result: {selected_encounter}")
+            self.populate(selected_encounter, time_slot, encounters_data[selected_encounter])
+
+            log_info(f"{time_slot} encounter: {selected_encounter} (zone: {zone}, weight: {selected_weight:.2f})")
+            verbose_print("  Result: {}", selected_encounter)
             
         except Exception as e:
             log_info(f"Error generating site encounter: {e}")
-            verbose_print(f"  Error: {e}")
+            verbose_print("  Error: {}", e)
             # Set to no encounter on error
-            self.name = None
-            self.time = None
-            self.sparks = []
-            self.description = None
-            self.habitat = None
+            self._clear()
     
     def is_encounter(self) -> bool:
         """
@@ -231,11 +281,28 @@ class Encounter:
 
 class Weather:
     """Represents weather conditions for a day."""
-    
+
+    __slots__ = ('name', 'effects', 'display_html')
+
+    # Shared empty effects for weatherless instances (immutable, safe to share)
+    _NO_EFFECTS = ()
+
     def __init__(self) -> None:
         """Initialize empty weather."""
         self.name: Optional[str] = None
-        self.effects: List[str] = []
+        self.effects: Sequence[str] = Weather._NO_EFFECTS
+        self.display_html: str = ''
+        self._update_display_html()
+
+    def _update_display_html(self) -> None:
+        """Rebuild the cached display HTML; called whenever weather changes."""
+        if self.name is None:
+            self.display_html = 'No weather generated'
+        elif not self.effects:
+            self.display_html = f'Weather: <span class="emphasis">{html.escape(self.name)}</span>'
+        else:
+            self.display_html = (f'Weather: <span class="emphasis">{html.escape(self.name)}</span> '
+                                 f'({html.escape(", ".join(self.effects))})')
     
     def generate_weather(
         self,
@@ -249,8 +316,9 @@ class Weather:
         
         Algorithm:
         1. Get probability weights for season
-        2. Roll weighted random selection
-        3. Handle "No Change" (re-roll on Day 1, keep previous otherwise)
+        2. Select weather with a single draw (on Day 1 "No Change" is
+           dropped and the remainder renormalized instead of re-rolling)
+        3. Handle "No Change" (keep previous weather)
         4. Look up weather details and populate
         
         Args:
@@ -259,59 +327,74 @@ class Weather:
             weather_by_season: 2D xarray [Weather, Season]
             weathers_data: Dictionary of weather details
         """
-        from utils import weighted_random_choice, verbose_print
-        from logger import log_info
-        
-        max_attempts = 100  # Prevent infinite loop
-        attempt = 0
-        
-        while attempt < max_attempts:
-            attempt += 1
-            
-            # Step 1-2: Get weights and select weather
-            weights = {}
-            for weather_name in weather_by_season.coords['Weather'].values:
-                weight = float(weather_by_season.loc[weather_name, season])
-                if weight > 0:
-                    weights[weather_name] = weight
-            
-            if not weights:
-                log_info(f"No valid weather types for season {season}")
+        import config
+
+        # Step 1: Get the per-season (names, weights, prob, alias) tuple
+        # (built by data_loader; season weights never change between days).
+        # Fall back to slicing the 2D array if the caches haven't been built.
+        cached = config.weather_weights.get(season)
+        if cached is not None:
+            names, weights_arr, prob, alias = cached
+        else:
+            names = weather_by_season.coords['Weather'].values
+            weights_arr = weather_by_season.sel(Season=season).values
+            mask = weights_arr > 0
+            names = names[mask]
+            weights_arr = weights_arr[mask]
+            prob, alias = build_alias(weights_arr) if len(names) else (None, None)
+
+        if len(names) == 0:
+            log_info(f"No valid weather types for season {season}")
+            self.name = "Clear"
+            self.effects = Weather._NO_EFFECTS
+            self._update_display_html()
+            return
+
+        # Step 2: Select weather with a single draw
+        if previous_weather is None:
+            # Day 1: there is no previous weather to keep, so draw from the
+            # cached per-season distribution with "No Change" already
+            # removed and renormalized (built alongside weather_weights)
+            day1 = config.weather_weights_no_nc.get(season)
+            if day1 is not None:
+                day1_names, day1_weights, cumulative, total = day1
+            else:
+                mask = names != "No Change"
+                day1_names = names[mask]
+                day1_weights = weights_arr[mask]
+                cumulative = np.cumsum(day1_weights)
+                total = float(cumulative[-1]) if len(cumulative) else 0.0
+            if len(day1_names) == 0 or total <= 0:
+                log_info(f"Only 'No Change' weather for season {season}, defaulting to Clear")
                 self.name = "Clear"
-                self.effects = []
+                self.effects = Weather._NO_EFFECTS
+                self._update_display_html()
                 return
-            
-            selected_weather = weighted_random_choice(weights)
-            
-            # Step 3: Handle "No Change"
-            if selected_weather == "No Change":
-                if previous_weather is None:
-                    # Day 1: Re-roll until we get actual weather
-                    verbose_print(f"  Weather roll attempt {attempt}: 'No Change' on Day 1, re-rolling...")
-                    continue
-                else:
-                    # Keep previous weather
-                    self.name = previous_weather.name
-                    self.effects = previous_weather.effects
-                    log_info(f"Weather: No Change (keeping {self.name})")
-                    verbose_print(f"  Weather: No Change (keeping {self.name})")
-                    return
-            
-            # Step 4: Look up and populate weather details
-            weather_info = weathers_data.get(selected_weather, {'effects': []})
-            self.name = selected_weather
-            self.effects = weather_info['effects']
-            
-            log_info(f"Weather: {self.name} (effects: {', '.join(self.effects) if self.effects else 'none'})")
-            verbose_print(f"  Weather: {self.name}")
-            if self.effects:
-                verbose_print(f"    Effects: {', '.join(self.effects)}")
+            idx = int(np.searchsorted(cumulative, random.random() * total))
+            selected_weather = str(day1_names[min(idx, len(day1_names) - 1)])
+        else:
+            # O(1) alias-table draw over the full distribution
+            selected_weather = str(names[alias_sample(prob, alias)])
+
+        # Step 3: Handle "No Change" (only reachable after Day 1)
+        if selected_weather == "No Change":
+            self.name = previous_weather.name
+            self.effects = previous_weather.effects
+            self._update_display_html()
+            log_info(f"Weather: No Change (keeping {self.name})")
+            verbose_print("  Weather: No Change (keeping {})", self.name)
             return
-        
-        # Fallback if we somehow hit max attempts
-        log_info(f"Weather generation hit max attempts, defaulting to Clear")
-        self.name = "Clear"
-        self.effects = []
+
+        # Step 4: Look up and populate weather details
+        weather_info = weathers_data.get(selected_weather, {'effects': []})
+        self.name = selected_weather
+        self.effects = weather_info['effects']
+        self._update_display_html()
+
+        log_info(f"Weather: {self.name} (effects: {', '.join(self.effects) if self.effects else 'none'})")
+        verbose_print("  Weather: {}", self.name)
+        if self.effects:
+            verbose_print("    Effects: {}", ', '.join(self.effects))
     
     def __str__(self) -> str:
         """String representation for display."""
@@ -324,42 +407,43 @@ class Weather:
 
 class Timer:
     """Represents a countdown timer in Site Mode."""
-    
+
+    __slots__ = ('name', 'expires_at', 'display_html')
+
     def __init__(self, name: str = "", remaining_duration: int = 60) -> None:
         """
         Initialize a timer.
-        
+
         Args:
             name: Description of what the timer tracks
             remaining_duration: Starting duration in minutes (default 60)
         """
+        import config
+
         self.name: str = name
-        self.remaining_duration: int = remaining_duration  # Allow negative values
-    
-    def decrement_timer(self, amount: int = 10) -> str:
-        """
-        Decrease timer by specified amount.
-        
-        Args:
-            amount: Minutes to subtract (default 10 for standard turn)
-        
-        Returns:
-            "active" if remaining_duration >= 0
-            "expired" if remaining_duration < 0
-        """
-        from logger import log_info
-        from utils import verbose_print
-        
-        self.remaining_duration -= amount  # Allow going negative
-        
-        if self.remaining_duration >= 0:
-            verbose_print(f"  Timer '{self.name}': {self.remaining_duration} minutes remaining")
-            return "active"
+        # Absolute site-clock minute the timer runs out; the remaining
+        # duration is derived, so turn advance never touches live timers
+        self.expires_at: int = config.generated_site_time + remaining_duration
+        self.display_html: str = ''
+        self._update_display_html()
+
+    @property
+    def remaining_duration(self) -> int:
+        """Minutes left on the site clock (negative once expired)."""
+        import config
+
+        return self.expires_at - config.generated_site_time
+
+    def _update_display_html(self) -> None:
+        """Rebuild the cached display HTML; called whenever the clock changes."""
+        remaining = self.remaining_duration
+        if remaining < 0:
+            self.display_html = f'⚠️ EXPIRED: {html.escape(self.name)}'
+        elif remaining < 10:
+            self.display_html = f'Current: <span class="emphasis">{html.escape(self.name)}</span>'
         else:
-            log_info(f"Timer expired: {self.name}")
-            verbose_print(f"  Timer '{self.name}': EXPIRED (negative)")
-            return "expired"
-    
+            self.display_html = f'{remaining} minutes: {html.escape(self.name)}'
+
     def is_expired(self) -> bool:
         """Check if timer has gone negative (< 0)."""
         return self.remaining_duration < 0
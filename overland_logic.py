@@ -7,6 +7,7 @@ Functions:
 - overland_regenerate_day() -> None: Regenerates current day's content
 - generate_overland_weather() -> Weather: Creates weather instance for current day
 - generate_overland_encounters() -> Dict[str, Encounter]: Creates encounters for all watches
+- generate_overland_days(n) -> List[Dict[str, Encounter]]: Bulk-generates n days in one batch
 - generate_overland_rest_info() -> Dict: Generates rest information
 - regenerate_individual_weather() -> Weather: Regenerates only weather using current season
 - regenerate_individual_overland_encounter(watch: str) -> Encounter: Regenerates single encounter
@@ -14,11 +15,18 @@ Functions:
 Classes: None
 """
 
-from typing import Dict
+from typing import Dict, List, Optional
+import random
+import numpy as np
 import config
 from models import Weather, Encounter
 from logger import log_info
-from utils import verbose_print
+from utils import alias_sample, verbose_print
+
+# Shared empty defaults for restinfo lookups; avoids allocating a fresh
+# container on every miss in generate_overland_rest_info
+_EMPTY_DICT: Dict = {}
+_EMPTY_LIST: list = []
 
 
 def overland_reset() -> None:
@@ -53,14 +61,14 @@ def overland_new_day() -> None:
     config.generated_overland_days += 1
     
     log_info(f"Overland: Advanced to Day {config.generated_overland_days}")
-    verbose_print(f"=== New Day: Day {config.generated_overland_days} ===")
+    verbose_print("=== New Day: Day {} ===", config.generated_overland_days)
     
     # Generate all content
     generate_overland_weather()
     generate_overland_encounters()
     generate_overland_rest_info()
     
-    verbose_print(f"=== Day {config.generated_overland_days} complete ===")
+    verbose_print("=== Day {} complete ===", config.generated_overland_days)
 
 
 def overland_regenerate_day() -> None:
@@ -74,14 +82,14 @@ def overland_regenerate_day() -> None:
     4. Generate rest info
     """
     log_info(f"Overland: Regenerating Day {config.generated_overland_days}")
-    verbose_print(f"=== Regenerating Day {config.generated_overland_days} ===")
+    verbose_print("=== Regenerating Day {} ===", config.generated_overland_days)
     
     # Regenerate all content
     generate_overland_weather()
     generate_overland_encounters()
     generate_overland_rest_info()
     
-    verbose_print(f"=== Day {config.generated_overland_days} regeneration complete ===")
+    verbose_print("=== Day {} regeneration complete ===", config.generated_overland_days)
 
 
 def generate_overland_weather() -> Weather:
@@ -123,80 +131,234 @@ def generate_overland_weather() -> Weather:
 def generate_overland_encounters() -> Dict[str, Encounter]:
     """
     Generate encounters for all six watches of the day.
-    
+
+    The watches are independent, so their rolls are batched: one vectorized
+    batch of fused uniforms covers all six. Each watch's uniform is searched
+    against a fused CDF from the caches built at load time - the zone/overlay
+    mixture CDF when an overlay is set - deciding the active zone, occurrence
+    and identity in one draw.
+
     Algorithm:
-    1. Define watch list
-    2. Create empty encounters dictionary
-    3. For each watch, generate encounter
+    1. Pick each watch's CDF (zone/overlay mixture if overlay set)
+    2. Draw one uniform per watch in a single vectorized call
+    3. Search each uniform against the watch's fused CDF
     4. Set generated_overland_encounters
     5. Return encounters dictionary
-    
+
     Returns:
         Dictionary mapping watch names to Encounter objects
     """
     verbose_print("Generating encounters...")
-    
+
+    # Bind the config globals once; each config.X in the loop below would
+    # cost a module-attribute resolution per watch
+    zone = config.selected_overland_zone
+    overlay = config.selected_overland_overlay
+    watches = config.OVERLAND_WATCHES
+    enc_fused = config.enc_fused
+    enc_fused_mix = config.enc_fused_mix
+    encounters_data = config.encounters_data
+    count = len(watches)
+
+    # Step 1: Pick each watch's CDF. With an overlay the precomputed
+    # zone/overlay mixture absorbs the 50/50 active-zone coin, so no
+    # separate overlay roll is needed
+    if overlay is not None:
+        active_zone = f"{zone}/{overlay}"
+        cdfs = [enc_fused_mix.get((zone, overlay, watch)) for watch in watches]
+    else:
+        active_zone = zone
+        cdfs = [enc_fused.get((zone, watch)) for watch in watches]
+
+    # Step 2: One fused uniform per watch, drawn in a single batch
+    uniforms = np.random.random(count)
+
+    # Step 3: Resolve each watch's draw against its fused CDF
     encounters = {}
-    
-    for watch in config.OVERLAND_WATCHES:
-        verbose_print(f"  {watch}:")
-        
-        # Create new encounter instance
-        encounter = Encounter()
-        
-        # Generate encounter
-        encounter.generate_overland_encounter(
-            zone=config.selected_overland_zone,
-            overlay=config.selected_overland_overlay,
-            watch=watch,
-            encounters_data=config.encounters_data,
-            encounter_by_zone_and_watch=config.encounter_by_zone_and_watch,
-            zones_data=config.zones_data
-        )
-        
+    for i, watch in enumerate(watches):
+        encounter = Encounter()  # Initialized as "no encounter"
+
+        fused = cdfs[i]
+        if fused is None or len(fused[0]) == 0:
+            log_info(f"{watch} encounter: No valid encounters for {active_zone}/{watch}")
+        else:
+            names, weights_arr, cum_ext, total = fused
+            idx = int(np.searchsorted(cum_ext, uniforms[i] * total))
+            if idx >= len(names):
+                log_info(f"{watch} encounter: No encounter")
+                verbose_print("  {} ({}): no encounter", watch, active_zone)
+            else:
+                selected = str(names[idx])
+                encounter.populate(selected, watch, encounters_data[selected])
+                log_info(f"{watch} encounter: {selected} (zone: {active_zone}, weight: {float(weights_arr[idx]):.2f})")
+                verbose_print("  {} ({}): {}", watch, active_zone, selected)
+
         encounters[watch] = encounter
-    
+
     # Update global state
     config.generated_overland_encounters = encounters
-    
+
     return encounters
 
 
+def generate_overland_days(n: int) -> List[Dict[str, Encounter]]:
+    """
+    Generate n consecutive days of content in one vectorized batch.
+
+    Bulk counterpart of calling overland_new_day() n times, for flows that
+    pre-generate a stretch of travel: all encounter uniforms are drawn in a
+    single (n, 6) batch and searched against the fused CDFs, and weather
+    resolves the "No Change" carry-forward over n O(1) alias draws. Global
+    state (day counter, weather, encounters, rest info) is left exactly as
+    after the final day.
+
+    Args:
+        n: Number of days to generate
+
+    Returns:
+        List of per-day encounter dictionaries (watch -> Encounter), one per
+        generated day
+    """
+    if n <= 0:
+        return []
+
+    config.generated_overland_days += n
+    log_info(f"Overland: Advanced {n} days to Day {config.generated_overland_days}")
+    verbose_print("=== Generating {} days (to Day {}) ===", n, config.generated_overland_days)
+
+    zone = config.selected_overland_zone
+    overlay = config.selected_overland_overlay
+    season = config.selected_overland_season
+    watches = config.OVERLAND_WATCHES
+    count = len(watches)
+
+    # --- Weather: n draws with a sequential "No Change" carry-forward ---
+    previous = config.generated_overland_weather
+    weather = Weather()
+    cached = config.weather_weights.get(season)
+    if cached is None or len(cached[0]) == 0:
+        # No cached distribution; fall back to the single-day generator
+        weather.generate_weather(season, previous, config.weather_by_season, config.weathers_data)
+    else:
+        names, _weights, prob, alias = cached
+        if previous is None or previous.name is None:
+            # Day-1 rules for the first generated day
+            day1_names, _day1_weights, cumulative, total = config.weather_weights_no_nc[season]
+            if len(day1_names) == 0 or total <= 0:
+                current = "Clear"
+            else:
+                idx = int(np.searchsorted(cumulative, random.random() * total))
+                current = str(day1_names[min(idx, len(day1_names) - 1)])
+            start = 1
+        else:
+            current = previous.name
+            start = 0
+        for _ in range(start, n):
+            pick = str(names[alias_sample(prob, alias)])
+            if pick != "No Change":
+                current = pick
+        weather.name = current
+        weather.effects = config.weathers_data.get(current, {'effects': ()})['effects']
+        weather._update_display_html()
+        log_info(f"Weather after {n} days: {current}")
+    config.generated_overland_weather = weather
+
+    # --- Encounters: one (n, 6) uniform batch against the fused CDFs ---
+    uniforms = np.random.random((n, count))
+    if overlay is not None:
+        overlay_hits = np.random.random((n, count)) < 0.5
+    selected = np.full((n, count), None, dtype=object)
+
+    enc_fused = config.enc_fused
+    for w, watch in enumerate(watches):
+        if overlay is not None:
+            splits = ((zone, ~overlay_hits[:, w]), (overlay, overlay_hits[:, w]))
+        else:
+            splits = ((zone, slice(None)),)
+
+        for active_zone, rows in splits:
+            fused = enc_fused.get((active_zone, watch))
+            if fused is None or len(fused[0]) == 0:
+                continue
+            names, _weights, cum_ext, total = fused
+            u = uniforms[rows, w] * total
+            idx = np.searchsorted(cum_ext, u)
+            hit = idx < len(names)
+            picks = np.full(u.shape, None, dtype=object)
+            picks[hit] = names[idx[hit]]
+            selected[rows, w] = picks
+
+    # Build Encounter objects only after all sampling is done
+    encounters_data = config.encounters_data
+    days = []
+    for d in range(n):
+        day = {}
+        for w, watch in enumerate(watches):
+            encounter = Encounter()
+            name = selected[d, w]
+            if name is not None:
+                encounter.populate(str(name), watch, encounters_data[str(name)])
+            day[watch] = encounter
+        days.append(day)
+
+    generated = sum(1 for day in days for encounter in day.values() if encounter.is_encounter())
+    log_info(f"Generated {n} days of encounters ({generated} encounters across {n * count} watches)")
+
+    # Final-day state mirrors what n single-day calls would leave behind
+    config.generated_overland_encounters = days[-1]
+    generate_overland_rest_info()
+
+    verbose_print("=== {} days generated ===", n)
+
+    return days
+
+
+def _compute_rest_dcs(season: str) -> List:
+    """Return the rest DC table for a season (empty list if missing)."""
+    return config.restinfo_data.get('rest_DCs', _EMPTY_DICT).get(season, _EMPTY_LIST)
+
+
+def _compute_situational_modifiers() -> List:
+    """Return the situational modifiers (season- and weather-independent)."""
+    return config.restinfo_data.get('situational_modifiers', _EMPTY_LIST)
+
+
+def _compute_weather_modifiers(weather: Optional[Weather]) -> List:
+    """
+    Return the weather modifiers active for the given weather's effects.
+
+    Uses the effect_to_modifiers reverse index built at load, instead of
+    scanning every modifier per effect.
+    """
+    filtered_weather_modifiers = []
+    if weather and weather.effects:
+        effect_to_modifiers = config.effect_to_modifiers
+        for effect in weather.effects:
+            filtered_weather_modifiers.extend(effect_to_modifiers.get(effect, _EMPTY_LIST))
+    return filtered_weather_modifiers
+
+
 def generate_overland_rest_info() -> Dict:
     """
     Generate rest check information for current conditions.
-    
+
     Algorithm:
     1. Get rest_DCs for current season
-    2. Get weather_modifiers list
-    3. Filter weather_modifiers based on current weather effects
-    4. Get situational_modifiers (unfiltered)
-    5. Create rest_info dictionary
-    6. Set generated_overland_rest_info
-    7. Return rest_info
-    
+    2. Look up weather modifiers for each active effect (reverse index)
+    3. Get situational_modifiers (unfiltered)
+    4. Create rest_info dictionary
+    5. Set generated_overland_rest_info
+    6. Return rest_info
+
     Returns:
         Dictionary containing rest check information
     """
     verbose_print("Generating rest info...")
-    
-    # Get rest DCs for current season
-    rest_dcs = config.restinfo_data.get('rest_DCs', {}).get(config.selected_overland_season, [])
-    
-    # Get all weather modifiers
-    all_weather_modifiers = config.restinfo_data.get('weather_modifiers', [])
-    
-    # Filter weather modifiers based on current weather effects
-    filtered_weather_modifiers = []
-    if config.generated_overland_weather and config.generated_overland_weather.effects:
-        current_effects = config.generated_overland_weather.effects
-        for modifier in all_weather_modifiers:
-            if modifier['effect'] in current_effects:
-                filtered_weather_modifiers.append(modifier)
-    
-    # Get situational modifiers (unfiltered)
-    situational_modifiers = config.restinfo_data.get('situational_modifiers', [])
-    
+
+    rest_dcs = _compute_rest_dcs(config.selected_overland_season)
+    filtered_weather_modifiers = _compute_weather_modifiers(config.generated_overland_weather)
+    situational_modifiers = _compute_situational_modifiers()
+
     # Create rest info dictionary
     rest_info = {
         'rest_dcs': rest_dcs,
@@ -224,7 +386,8 @@ def regenerate_individual_weather() -> Weather:
     2. Create new Weather instance
     3. Call weather.generate_weather() with CURRENT season
     4. Set generated_overland_weather
-    5. Regenerate rest info (depends on weather)
+    5. Refresh only the weather modifiers in rest info (DCs and
+       situational modifiers don't depend on weather)
     6. Return weather instance
     
     Returns:
@@ -250,9 +413,14 @@ def regenerate_individual_weather() -> Weather:
     # Update global state
     config.generated_overland_weather = weather
     
-    # Regenerate rest info (weather affects modifiers)
-    generate_overland_rest_info()
-    
+    # Only the weather modifiers depend on the new weather; the rest DCs
+    # and situational modifiers are unchanged, so update in place
+    rest_info = config.generated_overland_rest_info
+    if rest_info is not None:
+        rest_info['weather_modifiers'] = _compute_weather_modifiers(weather)
+    else:
+        generate_overland_rest_info()
+
     verbose_print("=== Weather regeneration complete ===")
     
     return weather
@@ -277,7 +445,7 @@ def regenerate_individual_overland_encounter(watch: str) -> Encounter:
         Regenerated Encounter object
     """
     log_info(f"Overland: Regenerating {watch} encounter")
-    verbose_print(f"=== Regenerating {watch} Encounter ===")
+    verbose_print("=== Regenerating {} Encounter ===", watch)
     
     # Create new encounter instance
     encounter = Encounter()
@@ -295,6 +463,6 @@ def regenerate_individual_overland_encounter(watch: str) -> Encounter:
     # Update global state
     config.generated_overland_encounters[watch] = encounter
     
-    verbose_print(f"=== {watch} encounter regeneration complete ===")
+    verbose_print("=== {} encounter regeneration complete ===", watch)
     
     return encounter
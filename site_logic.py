@@ -5,7 +5,7 @@ Functions:
 - site_reset() -> None: Resets all site state variables
 - site_new_turn() -> None: Advances turn by 10 minutes and updates state
 - site_regenerate_turn() -> None: Regenerates current turn's encounters
-- generate_site_encounters(include_current: bool = False) -> Dict[str, Encounter]: Creates encounters for all time slots
+- generate_site_encounters(include_current: bool = False) -> deque: Creates encounters for all time slots
 - site_add_timer(name: str, duration: int = 60) -> None: Creates and adds new timer
 - site_delete_timer(timer_index: int) -> None: Removes timer from list
 - regenerate_individual_site_encounter(time_slot: str) -> Encounter: Regenerates single encounter
@@ -13,12 +13,17 @@ Functions:
 Classes: None
 """
 
-from typing import Dict
+from collections import deque
+import heapq
+import itertools
 import config
 from models import Encounter, Timer
 from logger import log_info, log_error
 from utils import verbose_print
 
+# Tie-breaker for timer heap entries so Timers never get compared directly
+_timer_counter = itertools.count()
+
 
 def site_reset() -> None:
     """
@@ -34,9 +39,9 @@ def site_reset() -> None:
     
     config.generated_site_time = 0
     config.generated_site_timers = []
-    
-    # Clear expansion states
-    app.storage.user['site_expansions'] = {}
+
+    # Clear expansion states (one bool per slot, in ring order)
+    app.storage.user['site_expansions'] = [False] * len(config.SITE_TIME_SLOTS)
     
     # Generate initial encounters (Current is empty, next 5 are generated)
     generate_site_encounters(include_current=False)
@@ -51,7 +56,7 @@ def site_new_turn() -> None:
     
     Algorithm:
     1. Increment generated_site_time by 10
-    2. Update timers (decrement and remove expired)
+    2. Update timers (pop expired off the heap, refresh displays)
     3. Advance encounters (shift up one slot)
     4. Shift expansion states along with encounters
     5. Generate new 50 minutes encounter
@@ -61,49 +66,35 @@ def site_new_turn() -> None:
     config.generated_site_time += 10
     
     log_info(f"Site: Advanced to {config.generated_site_time} minutes")
-    verbose_print(f"=== New Turn: {config.generated_site_time} minutes ===")
+    verbose_print("=== New Turn: {} minutes ===", config.generated_site_time)
     
-    # Step 2: Update timers
+    # Step 2: Update timers - expiry is an absolute site-clock minute, so
+    # only timers that actually ran out are popped off the top of the heap
     verbose_print("Updating timers...")
-    
-    for timer in config.generated_site_timers:
-        timer.decrement_timer(10)
-    
-    # Remove timers that have gone negative
-    # Keep timers that are 0 or positive
-    config.generated_site_timers = [t for t in config.generated_site_timers if t.remaining_duration >= 0]
+
+    timers = config.generated_site_timers
+    while timers and timers[0][0] < config.generated_site_time:
+        _, _, expired = heapq.heappop(timers)
+        log_info(f"Timer expired: {expired.name}")
+        verbose_print("  Timer '{}': EXPIRED (negative)", expired.name)
+
+    # Refresh the cached display of survivors (remaining time moved with the clock)
+    for _, _, timer in timers:
+        timer._update_display_html()
+        verbose_print("  Timer '{}': {} minutes remaining", timer.name, timer.remaining_duration)
     
     # Step 3: Shift expansion states before shifting encounters
-    # Get current expansion states
-    old_expansions = app.storage.user.get('site_expansions', {})
-    new_expansions = {}
-    
-    # Shift expansion states along with encounters
-    # If "20 minutes" was expanded, "10 minutes" should be expanded after shift
-    new_expansions["Current"] = old_expansions.get("10 minutes", False)
-    new_expansions["10 minutes"] = old_expansions.get("20 minutes", False)
-    new_expansions["20 minutes"] = old_expansions.get("30 minutes", False)
-    new_expansions["30 minutes"] = old_expansions.get("40 minutes", False)
-    new_expansions["40 minutes"] = old_expansions.get("50 minutes", False)
-    new_expansions["50 minutes"] = False  # New encounter, not expanded
-    
-    # Save shifted expansion states
-    app.storage.user['site_expansions'] = new_expansions
-    
-    # Step 4: Advance encounters
+    # If "20 minutes" was expanded, "10 minutes" should be expanded after
+    # the shift; the new "50 minutes" slot starts collapsed
+    old_expansions = app.storage.user.get('site_expansions') or [False] * len(config.SITE_TIME_SLOTS)
+    app.storage.user['site_expansions'] = list(old_expansions[1:]) + [False]
+
+    # Step 4: Advance encounters - the ring buffer drops "Current" off the
+    # front and the new "50 minutes" encounter goes on the back
     verbose_print("Advancing encounters...")
-    
-    # Shift encounters up
-    old_encounters = config.generated_site_encounters.copy()
-    new_encounters = {}
-    
-    # Current becomes what was at 10 minutes
-    new_encounters["Current"] = old_encounters.get("10 minutes", Encounter())
-    new_encounters["10 minutes"] = old_encounters.get("20 minutes", Encounter())
-    new_encounters["20 minutes"] = old_encounters.get("30 minutes", Encounter())
-    new_encounters["30 minutes"] = old_encounters.get("40 minutes", Encounter())
-    new_encounters["40 minutes"] = old_encounters.get("50 minutes", Encounter())
-    
+
+    config.generated_site_encounters.popleft()
+
     # Generate new 50 minutes encounter
     verbose_print("  Generating new 50 minutes encounter:")
     new_50_encounter = Encounter()
@@ -114,12 +105,9 @@ def site_new_turn() -> None:
         encounter_by_zone=config.encounter_by_zone,
         zones_data=config.zones_data
     )
-    new_encounters["50 minutes"] = new_50_encounter
-    
-    # Update global state
-    config.generated_site_encounters = new_encounters
+    config.generated_site_encounters.append(new_50_encounter)
     
-    verbose_print(f"=== Turn {config.generated_site_time} minutes complete ===")
+    verbose_print("=== Turn {} minutes complete ===", config.generated_site_time)
 
 
 def site_regenerate_turn() -> None:
@@ -132,49 +120,47 @@ def site_regenerate_turn() -> None:
     3. Regenerate all 6 encounter slots (including Current)
     """
     log_info(f"Site: Regenerating turn at {config.generated_site_time} minutes")
-    verbose_print(f"=== Regenerating Turn: {config.generated_site_time} minutes ===")
+    verbose_print("=== Regenerating Turn: {} minutes ===", config.generated_site_time)
     
     # Regenerate all encounters (including Current this time)
     generate_site_encounters(include_current=True)
     
-    verbose_print(f"=== Turn regeneration complete ===")
+    verbose_print("=== Turn regeneration complete ===")
 
 
-def generate_site_encounters(include_current: bool = False) -> Dict[str, Encounter]:
+def generate_site_encounters(include_current: bool = False) -> deque:
     """
     Generate encounters for current turn and next 5 turns.
-    
+
     Algorithm:
-    1. Define time slots
-    2. Create empty encounters dictionary
-    3. For each time slot:
+    1. For each time slot (in ring order, "Current" first):
        - If Current and include_current=False: create empty encounter
        - Otherwise: generate encounter
-    4. Set generated_site_encounters
-    5. Return encounters dictionary
-    
+    2. Set generated_site_encounters (ring buffer)
+    3. Return encounters ring
+
     Args:
         include_current: If True, generate encounter for "Current" slot
                         If False, leave "Current" as empty (used on initial reset)
-    
+
     Returns:
-        Dictionary mapping time slot names to Encounter objects
+        Ring buffer of Encounter objects, one per SITE_TIME_SLOTS slot
     """
     verbose_print("Generating site encounters...")
-    
-    encounters = {}
-    
-    for time_slot in config.SITE_TIME_SLOTS:
-        if time_slot == "Current" and not include_current:
+
+    encounters: deque = deque(maxlen=len(config.SITE_TIME_SLOTS))
+
+    for slot_idx, time_slot in enumerate(config.SITE_TIME_SLOTS):
+        if slot_idx == 0 and not include_current:
             # Leave Current empty on initial reset
-            encounters["Current"] = Encounter()
-            verbose_print(f"  Current: (empty)")
+            encounters.append(Encounter())
+            verbose_print("  Current: (empty)")
         else:
-            verbose_print(f"  {time_slot}:")
-            
+            verbose_print("  {}:", time_slot)
+
             # Create new encounter instance
             encounter = Encounter()
-            
+
             # Generate encounter
             encounter.generate_site_encounter(
                 zone=config.selected_site_zone,
@@ -183,12 +169,12 @@ def generate_site_encounters(include_current: bool = False) -> Dict[str, Encount
                 encounter_by_zone=config.encounter_by_zone,
                 zones_data=config.zones_data
             )
-            
-            encounters[time_slot] = encounter
-    
+
+            encounters.append(encounter)
+
     # Update global state
     config.generated_site_encounters = encounters
-    
+
     return encounters
 
 
@@ -199,9 +185,8 @@ def site_add_timer(name: str, duration: int = 60) -> None:
     Algorithm:
     1. Validate duration >= 0
     2. Create new Timer instance
-    3. Append to generated_site_timers
-    4. Sort timers by remaining_duration (shortest first)
-    
+    3. Push (expires_at, insert order, timer) onto the timer heap
+
     Args:
         name: Description of what timer tracks
         duration: Starting duration in minutes (default 60)
@@ -209,18 +194,15 @@ def site_add_timer(name: str, duration: int = 60) -> None:
     # Validate duration
     if duration < 0:
         duration = 0
-    
+
     # Create timer
     timer = Timer(name=name, remaining_duration=duration)
-    
-    # Add to list
-    config.generated_site_timers.append(timer)
-    
-    # Sort by remaining duration (shortest first)
-    config.generated_site_timers.sort(key=lambda t: t.remaining_duration)
-    
+
+    # O(log n) heap insert instead of append + full sort
+    heapq.heappush(config.generated_site_timers, (timer.expires_at, next(_timer_counter), timer))
+
     log_info(f"Timer added: {name} ({duration} minutes)")
-    verbose_print(f"Timer added: {name} ({duration} minutes)")
+    verbose_print("Timer added: {} ({} minutes)", name, duration)
 
 
 def site_delete_timer(timer_index: int) -> None:
@@ -228,28 +210,32 @@ def site_delete_timer(timer_index: int) -> None:
     Manually remove a timer from the active timers list.
     
     Algorithm:
-    1. Validate timer_index
+    1. Validate timer_index (position in the sorted display order)
     2. Get timer name for logging
-    3. Remove timer from list
+    3. Remove the entry and restore the heap invariant
     4. Log deletion
-    
+
     Args:
-        timer_index: Index of timer in generated_site_timers list
+        timer_index: Index of timer in expiry-sorted display order
     """
+    timers = config.generated_site_timers
+
     # Validate index
-    if timer_index < 0 or timer_index >= len(config.generated_site_timers):
+    if timer_index < 0 or timer_index >= len(timers):
         log_error(f"Invalid timer index: {timer_index}")
         return
-    
-    # Get timer name
-    timer = config.generated_site_timers[timer_index]
-    timer_name = timer.name
-    
+
+    # The UI lists timers in expiry-sorted order, so resolve the index
+    # against that view; a handful of timers makes the sort trivial
+    entry = sorted(timers)[timer_index]
+    timer_name = entry[2].name
+
     # Remove timer
-    del config.generated_site_timers[timer_index]
-    
+    timers.remove(entry)
+    heapq.heapify(timers)
+
     log_info(f"Timer deleted: {timer_name}")
-    verbose_print(f"Timer deleted: {timer_name}")
+    verbose_print("Timer deleted: {}", timer_name)
 
 
 def regenerate_individual_site_encounter(time_slot: str) -> Encounter:
@@ -261,7 +247,7 @@ def regenerate_individual_site_encounter(time_slot: str) -> Encounter:
     Algorithm:
     1. Create new Encounter instance
     2. Call encounter.generate_site_encounter() with CURRENT zone
-    3. Update generated_site_encounters[time_slot]
+    3. Update the slot's ring-buffer position (SITE_SLOT_INDEX)
     4. Return encounter instance
     
     Args:
@@ -271,7 +257,7 @@ def regenerate_individual_site_encounter(time_slot: str) -> Encounter:
         Regenerated Encounter object
     """
     log_info(f"Site: Regenerating {time_slot} encounter")
-    verbose_print(f"=== Regenerating {time_slot} Encounter ===")
+    verbose_print("=== Regenerating {} Encounter ===", time_slot)
     
     # Create new encounter instance
     encounter = Encounter()
@@ -286,8 +272,8 @@ def regenerate_individual_site_encounter(time_slot: str) -> Encounter:
     )
     
     # Update global state
-    config.generated_site_encounters[time_slot] = encounter
-    
-    verbose_print(f"=== {time_slot} encounter regeneration complete ===")
+    config.generated_site_encounters[config.SITE_SLOT_INDEX[time_slot]] = encounter
+
+    verbose_print("=== {} encounter regeneration complete ===", time_slot)
     
     return encounter
@@ -3,13 +3,18 @@ utils.py - Utility functions for Torchcrawl GM Control Panel
 
 Functions:
 - weighted_random_choice(weights: Dict[str, float]) -> str: Select random key based on weighted probabilities
+- weighted_random_choice_arr(names, weights) -> str: Array-based weighted selection for hot paths
+- build_alias(weights) -> (prob, alias): Build a Walker/Vose alias table for O(1) sampling
+- alias_sample(prob, alias) -> int: Draw an index from an alias table
 - parse_percentage(percentage_str: str) -> float: Convert percentage string to float (0.0-1.0)
-- verbose_print(message: str) -> None: Print to console if verbose mode enabled
+- parse_percentages_bulk(percentage_strs) -> np.ndarray: Vectorized percentage parsing for whole columns
+- verbose_print(message, *args) -> None: Print to console if verbose mode enabled (lazy formatting)
 - is_verbose() -> bool: Check if verbose mode is enabled
 - format_time_display(minutes: int) -> str: Format time with hours/minutes if > 50
 - get_calendar_date_string() -> str: Format current calendar date for display
 - get_current_season() -> str: Get season from current calendar month
 - advance_calendar_date(days: int) -> bool: Advance calendar date and save to file
+- advance_time(days: int) -> bool: Advance date and lunar day with one combined save
 - get_current_holiday() -> dict | None: Get holiday for current date if any
 - get_moon_phase_info() -> dict | None: Get current moon phase name, icon, index
 - get_moon_phase_for_day(lunar_day, cycle_length) -> dict: Get phase info for specific lunar day
@@ -21,9 +26,24 @@ Functions:
 Classes: None
 """
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
+from functools import lru_cache
+import itertools
 import random
-import math
+import numpy as np
+
+# Module-local RNG for the draw helpers below: _rand is a bound method, so
+# each draw skips the random-module attribute hop of the global functions.
+# Seed via _rng.seed(...) for a reproducible session.
+_rng = random.Random()
+_rand = _rng.random
+try:
+    # Optional: JIT-compiles the alias pick kernel to machine code. The
+    # pure-Python fallback below is used when numba isn't installed.
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
 
 # Global variable for verbose mode (set by command line argument)
 _VERBOSE_MODE = False
@@ -50,22 +70,28 @@ def is_verbose() -> bool:
     return _VERBOSE_MODE
 
 
-def verbose_print(message: str) -> None:
+def verbose_print(message: str, *args) -> None:
     """
     Print message to console only if verbose mode is enabled.
-    
+
+    Hot-path callers pass a format string plus arguments so the formatting
+    cost (str.format, float rounding) is only paid when verbose mode is on;
+    pre-formatted strings with no arguments still work unchanged.
+
     Args:
-        message: String to print
-    
+        message: String to print, or a str.format template if args are given
+        *args: Optional values substituted into the template when printing
+
     Side effects:
         Prints to stdout if is_verbose() returns True
-    
+
     Example:
         verbose_print("Generated weather: Heavy Rains")
-        # Only prints if -v flag was used
+        verbose_print("  Encounter roll: {:.2f} vs threshold {:.2f}", roll, chance)
+        # Only prints (and formats) if -v flag was used
     """
-    if is_verbose():
-        print(f"[VERBOSE] {message}")
+    if _VERBOSE_MODE:
+        print(f"[VERBOSE] {message.format(*args) if args else message}")
 
 
 def weighted_random_choice(weights: Dict[str, float]) -> str:
@@ -74,11 +100,10 @@ def weighted_random_choice(weights: Dict[str, float]) -> str:
     
     Algorithm:
     1. Filter out entries with weight <= 0
-    2. Calculate total weight (sum of all values)
+    2. Build cumulative weights (single pass)
     3. If total weight == 0: raise ValueError
-    4. Generate random number between 0 and total_weight
-    5. Iterate through weights, accumulating until random number reached
-    6. Return selected key
+    4. Draw via random.choices with the precomputed cum_weights
+       (C-implemented binary search inside CPython)
     
     Args:
         weights: Dictionary mapping choices to weights (higher = more likely)
@@ -95,36 +120,152 @@ def weighted_random_choice(weights: Dict[str, float]) -> str:
         # A has 70% chance, B has 20% chance, C has 10% chance
         result = weighted_random_choice(weights)
     """
-    # Filter out zero/negative weights
-    valid_weights = {k: v for k, v in weights.items() if v > 0}
-    
-    if not valid_weights:
+    # Filter out zero/negative weights; typical tables are all-positive, so
+    # check that first (bails at the first offender) and skip the filter pass
+    if weights and all(v > 0 for v in weights.values()):
+        keys = list(weights)
+    else:
+        keys = [k for k, v in weights.items() if v > 0]
+
+    if not keys:
         raise ValueError("No valid weights provided (all weights are 0 or negative)")
-    
-    # Calculate total weight
-    total_weight = sum(valid_weights.values())
-    
-    if total_weight == 0:
+
+    # Cumulative weights in one pass; random.choices binary-searches them in C
+    cum_weights = list(itertools.accumulate(weights[k] for k in keys))
+
+    if cum_weights[-1] == 0:
         raise ValueError("Total weight is 0")
-    
-    # Generate random number
-    rand_value = random.uniform(0, total_weight)
-    
-    # Select based on cumulative weights
-    cumulative = 0
-    for key, weight in valid_weights.items():
-        cumulative += weight
-        if rand_value <= cumulative:
-            return key
-    
-    # Should never reach here, but return last key as fallback
-    return list(valid_weights.keys())[-1]
 
+    return _rng.choices(keys, cum_weights=cum_weights, k=1)[0]
+
+
+def weighted_random_choice_arr(names: np.ndarray, weights: np.ndarray) -> str:
+    """
+    Select a name from parallel name/weight arrays.
+
+    NumPy counterpart of weighted_random_choice: one cumulative sum and a
+    binary search instead of a Python-level dict scan. Callers are expected
+    to have filtered out non-positive weights already.
+
+    Args:
+        names: Array of choice names
+        weights: Array of positive weights, aligned with names
+
+    Returns:
+        Selected name (string)
+
+    Raises:
+        ValueError: If the total weight is not positive
+    """
+    total = float(weights.sum())
+    if total <= 0:
+        raise ValueError("No valid weights provided (all weights are 0 or negative)")
+
+    if _njit is not None:
+        idx = int(_weighted_pick(np.ascontiguousarray(weights, dtype=np.float64),
+                                 _rand() * total))
+    else:
+        cumulative = np.cumsum(weights)
+        idx = int(np.searchsorted(cumulative, _rand() * total))
+    return str(names[min(idx, len(names) - 1)])
+
+
+def _weighted_pick(weights: np.ndarray, r: float) -> int:
+    """
+    Cumulative-scan pick kernel; JIT-compiled when numba is available.
+
+    A single counted loop over a contiguous float64 array, so the compiled
+    version needs no cumsum allocation. Only used when numba is installed;
+    interpreted callers take the NumPy cumsum + searchsorted path instead.
+    """
+    cumulative = 0.0
+    for i in range(weights.shape[0]):
+        cumulative += weights[i]
+        if r < cumulative:
+            return i
+    return weights.shape[0] - 1
+
+
+def build_alias(weights: np.ndarray) -> tuple:
+    """
+    Build a Walker/Vose alias table from an array of positive weights.
+
+    The table makes every subsequent draw O(1) - one uniform picks a bucket,
+    a second uniform decides between the bucket and its alias - instead of
+    the O(k) cumulative scan of weighted_random_choice. Build once per
+    weight distribution and sample with alias_sample.
+
+    Args:
+        weights: Array of positive weights
+
+    Returns:
+        Tuple of (prob, alias) arrays of length k
+
+    Raises:
+        ValueError: If the total weight is not positive
+    """
+    weights = np.asarray(weights, dtype=np.float64)
+    k = len(weights)
+    total = float(weights.sum())
+    if total <= 0:
+        raise ValueError("No valid weights provided (all weights are 0 or negative)")
+
+    prob = np.ones(k, dtype=np.float64)
+    alias = np.zeros(k, dtype=np.int32)
+
+    # Scale so the average bucket holds exactly 1; split buckets into those
+    # under- and over-filled, then pair them off (Vose's algorithm)
+    scaled = weights * (k / total)
+    small = [i for i in range(k) if scaled[i] < 1.0]
+    large = [i for i in range(k) if scaled[i] >= 1.0]
+
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        (small if scaled[l] < 1.0 else large).append(l)
 
+    # Leftovers (from float rounding) keep their default prob of 1.0
+    return prob, alias
+
+
+def _pick_alias(prob: np.ndarray, alias: np.ndarray, u1: float, u2: float) -> int:
+    """Alias-table pick kernel; JIT-compiled when numba is available."""
+    i = int(u1 * len(prob))
+    if u2 < prob[i]:
+        return i
+    return int(alias[i])
+
+
+if _njit is not None:
+    _pick_alias = _njit(cache=True)(_pick_alias)
+    _weighted_pick = _njit(cache=True)(_weighted_pick)
+
+
+def alias_sample(prob: np.ndarray, alias: np.ndarray) -> int:
+    """
+    Draw one index from a Walker/Vose alias table built by build_alias.
+
+    Args:
+        prob: Bucket probabilities from build_alias
+        alias: Bucket aliases from build_alias
+
+    Returns:
+        Selected index into the original weights array
+    """
+    return int(_pick_alias(prob, alias, _rand(), _rand()))
+
+
+@lru_cache(maxsize=256)
 def parse_percentage(percentage_str: str) -> float:
     """
     Convert percentage string to float.
-    
+
+    Cached: the same handful of strings ("0%", "10%", "25%", ...) recur
+    across encounters and zones, so repeats cost a dict lookup.
+
     Algorithm:
     1. Strip whitespace
     2. Remove "%" symbol if present
@@ -164,13 +305,56 @@ def parse_percentage(percentage_str: str) -> float:
     return max(0.0, min(1.0, decimal_value))
 
 
+def parse_percentages_bulk(percentage_strs) -> np.ndarray:
+    """
+    Convert a sequence of percentage strings in one vectorized pass.
+
+    NumPy counterpart of parse_percentage for whole columns: the strip,
+    "%" removal, float conversion and clamp all run as C-level array ops
+    instead of one Python call per string.
+
+    Args:
+        percentage_strs: Sequence of strings like "15%", "15", " 15 %"
+
+    Returns:
+        float64 array of values clamped to [0.0, 1.0], aligned with input
+
+    Raises:
+        ValueError: If any string cannot be parsed as a number
+    """
+    if len(percentage_strs) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    cleaned = np.char.strip(np.char.rstrip(np.char.strip(
+        np.asarray(percentage_strs, dtype='U')), '%'))
+    try:
+        values = cleaned.astype(np.float64)
+    except ValueError:
+        # Re-parse one by one so the error names the offending string
+        for percentage_str in percentage_strs:
+            parse_percentage(percentage_str)
+        raise
+
+    return np.clip(values / 100.0, 0.0, 1.0)
+
+
+# Pluralized unit suffixes indexed by (count != 1); avoids a conditional
+# per unit inside the cached formatter
+_HOUR_UNITS = ('hour', 'hours')
+_MINUTE_UNITS = ('minute', 'minutes')
+
+
+@lru_cache(maxsize=2048)
 def format_time_display(minutes: int) -> str:
     """
     Format time display for Site mode.
-    
+
     If minutes <= 50: Return "X minutes"
     If minutes > 50: Return "X minutes (H hours M minutes)"
-    
+
+    Cached: the site clock only ever lands on a bounded set of values per
+    session, so repeat renders cost a dict lookup instead of a format.
+
     Args:
         minutes: Total minutes elapsed
     
@@ -187,16 +371,61 @@ def format_time_display(minutes: int) -> str:
     if minutes <= 50:
         return f"{minutes} minutes"
 
-    hours = minutes // 60
-    remaining_minutes = minutes % 60
+    hours, remaining_minutes = divmod(minutes, 60)
 
-    return f"{minutes} minutes ({hours} hour{'s' if hours != 1 else ''} {remaining_minutes} minute{'s' if remaining_minutes != 1 else ''})"
+    return (f"{minutes} minutes ({hours} {_HOUR_UNITS[hours != 1]} "
+            f"{remaining_minutes} {_MINUTE_UNITS[remaining_minutes != 1]})")
 
 
 # ============================================================================
 # CALENDAR UTILITY FUNCTIONS
 # ============================================================================
 
+# The calendar/lunar helpers need config and data_loader, but both import
+# this module (config via models), so neither can be imported at top level.
+# Bind them once on first use so later calls pay an if-check instead of an
+# import per call.
+_config_mod = None
+_data_loader_mod = None
+
+
+def _cfg():
+    """Return the config module, importing and caching it on first use."""
+    global _config_mod
+    if _config_mod is None:
+        import config
+        _config_mod = config
+    return _config_mod
+
+
+def _dl():
+    """Return the data_loader module, importing and caching it on first use."""
+    global _data_loader_mod
+    if _data_loader_mod is None:
+        import data_loader
+        _data_loader_mod = data_loader
+    return _data_loader_mod
+
+
+# Cache for calendar-derived display values, keyed by config.calendar_version.
+# UI refreshes call the getters several times per render; the underlying
+# calendar only changes when a save path bumps the version counter.
+_calendar_cache: Dict[str, tuple] = {}
+
+
+def _calendar_cached(key: str, compute: Callable):
+    """Return a cached value for the current calendar version, computing on miss."""
+    config = _cfg()
+
+    entry = _calendar_cache.get(key)
+    if entry is not None and entry[0] == config.calendar_version:
+        return entry[1]
+
+    value = compute()
+    _calendar_cache[key] = (config.calendar_version, value)
+    return value
+
+
 def get_calendar_date_string() -> str:
     """
     Format the current calendar date for display.
@@ -210,14 +439,19 @@ def get_calendar_date_string() -> str:
         date_str = get_calendar_date_string()
         # Returns: "Deepwinter 15 (Winter)"
     """
-    import config  # Lazy import to avoid circular dependency
+    return _calendar_cached('date_string', _compute_calendar_date_string)
+
+
+def _compute_calendar_date_string() -> str:
+    """Build the formatted date string (uncached; see get_calendar_date_string)."""
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return ""
 
     # Calendar loaded but no date set
-    current_date = config.calendar_data.get('current_date')
+    current_date = cd.get('current_date')
     if not current_date:
         return "No date set - set date via Calendar tab"
 
@@ -225,12 +459,8 @@ def get_calendar_date_string() -> str:
     month_idx = current_date.get('month', 1)
     day = current_date.get('day', 1)
 
-    # Get month info
-    months = config.calendar_data.get('months', [])
-    if month_idx < 1 or month_idx > len(months):
-        return "Invalid date"
-
-    month_info = months[month_idx - 1]
+    # Get month info (month_idx is validated at calendar load/save time)
+    month_info = cd['months'][month_idx - 1]
     month_name = month_info.get('name', 'Unknown')
     season = month_info.get('season', 'Unknown')
 
@@ -249,26 +479,27 @@ def get_current_season() -> str:
         season = get_current_season()
         # Returns: "Winter"
     """
-    import config  # Lazy import to avoid circular dependency
+    return _calendar_cached('season', _compute_current_season)
+
+
+def _compute_current_season() -> str:
+    """Look up the current month's season (uncached; see get_current_season)."""
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return ""
 
     # No date set
-    current_date = config.calendar_data.get('current_date')
+    current_date = cd.get('current_date')
     if not current_date:
         return ""
 
     # Get month index
     month_idx = current_date.get('month', 1)
 
-    # Get month info
-    months = config.calendar_data.get('months', [])
-    if month_idx < 1 or month_idx > len(months):
-        return ""
-
-    month_info = months[month_idx - 1]
+    # Get month info (month_idx is validated at calendar load/save time)
+    month_info = cd['months'][month_idx - 1]
     return month_info.get('season', '')
 
 
@@ -293,50 +524,89 @@ def advance_calendar_date(days: int = 1) -> bool:
         # Advance by multiple days
         success = advance_calendar_date(7)
     """
-    import config  # Lazy import to avoid circular dependency
-    from data_loader import save_calendar_date
+    fields = _advance_date_fields(days)
+    if fields is None:
+        return False
+    return _dl().save_calendar_date(*fields)
+
+
+def _advance_date_fields(days: int) -> Optional[tuple]:
+    """
+    Compute the calendar date after advancing, without saving.
+
+    Returns:
+        (month, day) after the advance, or None if no calendar/date is set
+    """
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
-        return False
+    if not cd:
+        return None
 
     # No date set - cannot advance
-    current_date = config.calendar_data.get('current_date')
+    current_date = cd.get('current_date')
     if not current_date:
-        return False
+        return None
 
     # Get current position
     month = current_date.get('month', 1)
     day = current_date.get('day', 1)
-    months = config.calendar_data.get('months', [])
+    months = cd.get('months', [])
 
     if not months:
-        return False
+        return None
+
+    # Jump straight to the target date: convert to a day-of-year, add, wrap
+    # modulo the year length, then binary-search the month prefix sums (built
+    # by ensure_calendar_cache) - O(log months) regardless of how far we move
+    cum_days = cd.get('_cum_days')
+    if cum_days is None or not cd.get('_year_length'):
+        return None
+
+    month_days = cd['_month_days']
+    year_length = cd['_year_length']
+
+    day_of_year = int(cum_days[month - 1]) - int(month_days[month - 1]) + (day - 1)
+    day_of_year = (day_of_year + days) % year_length
+
+    month = int(np.searchsorted(cum_days, day_of_year, side='right')) + 1
+    day = day_of_year - (int(cum_days[month - 1]) - int(month_days[month - 1])) + 1
+
+    return (month, day)
 
-    # Add days
-    day += days
 
-    # Handle overflow - advance months as needed
-    while True:
-        # Get days in current month
-        if month < 1 or month > len(months):
-            month = 1  # Safety wrap
+def advance_time(days: int = 1) -> bool:
+    """
+    Advance the calendar date and lunar day together.
+
+    Equivalent to advance_calendar_date(days) followed by
+    advance_lunar_day(days), but persists through a single combined
+    save_calendar_state call (one calendar_version bump, each file written
+    once) instead of two separate save cycles per game tick. When the
+    calendar has no lunar tracking, only the date advances.
+
+    Args:
+        days: Number of days to advance (default 1)
 
-        days_in_month = months[month - 1].get('days', 30)
+    Returns:
+        True if successful, False if no calendar/date or save failed
 
-        if day <= days_in_month:
-            break  # Day is valid for current month
+    Example:
+        success = advance_time(1)  # New Day: date + moon in one write pass
+    """
+    config = _cfg()
 
-        # Overflow to next month
-        day -= days_in_month
-        month += 1
+    date_fields = _advance_date_fields(days)
+    if date_fields is None:
+        return False
 
-        # Wrap to month 1 if past last month (no year tracking)
-        if month > len(months):
-            month = 1
+    # Calendar without lunar tracking: date-only save
+    if not config.calendar_data.get('lunar_cycle_length'):
+        return _dl().save_calendar_date(*date_fields)
 
-    # Save new date
-    return save_calendar_date(month, day)
+    lunar_day, is_blood_moon = _advance_lunar_fields(days)
+    return _dl().save_calendar_state(date_fields[0], date_fields[1],
+                                     lunar_day, is_blood_moon)
 
 
 def get_current_holiday() -> Optional[Dict]:
@@ -353,14 +623,20 @@ def get_current_holiday() -> Optional[Dict]:
             print(f"Today is {holiday['name']}")
             print(f"  {holiday['description']}")
     """
-    import config  # Lazy import to avoid circular dependency
+    return _calendar_cached('holiday', _compute_current_holiday)
+
+
+def _compute_current_holiday() -> Optional[Dict]:
+    """Find the holiday for the current date (uncached; see get_current_holiday)."""
+    config = _cfg()
+    cd = config.calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return None
 
     # No date set
-    current_date = config.calendar_data.get('current_date')
+    current_date = cd.get('current_date')
     if not current_date:
         return None
 
@@ -368,19 +644,11 @@ def get_current_holiday() -> Optional[Dict]:
     month_idx = current_date.get('month', 1)
     day = current_date.get('day', 1)
 
-    months = config.calendar_data.get('months', [])
-    if month_idx < 1 or month_idx > len(months):
-        return None
-
-    month_name = months[month_idx - 1].get('name', '')
-
-    # Search holidays for matching date
-    holidays = config.calendar_data.get('holidays', [])
-    for holiday in holidays:
-        if holiday.get('month') == month_name and holiday.get('day') == day:
-            return holiday
+    # month_idx is validated at calendar load/save time
+    month_name = cd['months'][month_idx - 1].get('name', '')
 
-    return None
+    # O(1) lookup against the (month name, day) index built at calendar load
+    return config.holiday_index.get((month_name, day))
 
 
 # ============================================================================
@@ -401,8 +669,37 @@ MOON_PHASES = [
 
 FULL_MOON_PHASE_INDEX = 4  # Index of Full Moon in MOON_PHASES
 
-
-def get_moon_phase_for_day(lunar_day: int, cycle_length: int) -> Dict:
+# One frozen record per phase, shared by reference: phase lookups return
+# these instead of allocating a dict per call. Callers that need to add
+# keys (see _compute_moon_phase_info) copy with dict(...)
+_PHASE_RECORDS = tuple(
+    MappingProxyType({
+        "name": phase["name"],
+        "icon": phase["icon"],
+        "phase_index": index,
+        "is_full_moon": index == FULL_MOON_PHASE_INDEX,
+    })
+    for index, phase in enumerate(MOON_PHASES)
+)
+
+# 2 x 8 (blood x phase) variant table: the blood row differs only at the
+# full moon, which renders as "Blood Moon". get_moon_phase_info indexes
+# this directly instead of branching and renaming per call.
+_PHASE_TABLE = (
+    tuple(MappingProxyType({**record, "is_blood_moon": False})
+          for record in _PHASE_RECORDS),
+    tuple(
+        MappingProxyType({
+            **record,
+            "name": "Blood Moon" if record["is_full_moon"] else record["name"],
+            "is_blood_moon": record["is_full_moon"],
+        })
+        for record in _PHASE_RECORDS
+    ),
+)
+
+
+def get_moon_phase_for_day(lunar_day: int, cycle_length: int) -> Mapping:
     """
     Get moon phase info for a specific lunar day.
 
@@ -411,33 +708,31 @@ def get_moon_phase_for_day(lunar_day: int, cycle_length: int) -> Dict:
         cycle_length: Total days in lunar cycle
 
     Returns:
-        Dict with keys: name, icon, phase_index, is_full_moon
+        Read-only mapping with keys: name, icon, phase_index, is_full_moon
+        (shared per phase - copy with dict(...) before mutating)
 
     Example:
         phase = get_moon_phase_for_day(14, 27)
         # Returns: {"name": "Full Moon", "icon": "🌕", "phase_index": 4, "is_full_moon": True}
     """
+    return _PHASE_RECORDS[_phase_index(lunar_day, cycle_length)]
+
+
+def _phase_index(lunar_day: int, cycle_length: int) -> int:
+    """
+    Phase index (0-7) for a lunar day; integer core of get_moon_phase_for_day.
+
+    Each phase spans cycle_length / 8 days, so (lunar_day - 1) / (cycle_length / 8)
+    rearranges to pure integer arithmetic with no float rounding risk. Out-of-range
+    days clamp to the cycle bounds.
+    """
     if lunar_day < 1:
         lunar_day = 1
-    if lunar_day > cycle_length:
+    elif lunar_day > cycle_length:
         lunar_day = cycle_length
 
-    # Calculate which phase (0-7) based on position in cycle
-    # Each phase spans cycle_length / 8 days
-    days_per_phase = cycle_length / 8.0
-    phase_index = int((lunar_day - 1) / days_per_phase)
-
-    # Clamp to valid range
-    if phase_index > 7:
-        phase_index = 7
-
-    phase = MOON_PHASES[phase_index]
-    return {
-        "name": phase["name"],
-        "icon": phase["icon"],
-        "phase_index": phase_index,
-        "is_full_moon": phase_index == FULL_MOON_PHASE_INDEX
-    }
+    index = ((lunar_day - 1) * 8) // cycle_length
+    return 7 if index > 7 else index
 
 
 def get_moon_phase_info() -> Optional[Dict]:
@@ -453,32 +748,32 @@ def get_moon_phase_info() -> Optional[Dict]:
         if phase:
             print(f"{phase['icon']} {phase['name']}")
     """
-    import config  # Lazy import to avoid circular dependency
+    return _calendar_cached('moon_phase', _compute_moon_phase_info)
+
+
+def _compute_moon_phase_info() -> Optional[Dict]:
+    """Build the current moon phase info (uncached; see get_moon_phase_info)."""
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return None
 
     # Get lunar data
-    lunar_day = config.calendar_data.get('lunar_day')
-    cycle_length = config.calendar_data.get('lunar_cycle_length', 27)
+    lunar_day = cd.get('lunar_day')
+    cycle_length = cd.get('lunar_cycle_length', 27)
 
     # No lunar day set
     if lunar_day is None:
         return None
 
-    # Get phase info
-    phase_info = get_moon_phase_for_day(lunar_day, cycle_length)
-
-    # Add blood moon status
-    is_blood_moon = config.calendar_data.get('is_blood_moon', False)
-    phase_info['is_blood_moon'] = is_blood_moon and phase_info['is_full_moon']
+    # Look up the precomputed variant (copied: the shared record is
+    # read-only); the blood row already carries the "Blood Moon" name and
+    # only applies it at the full moon
+    record = _PHASE_TABLE[bool(cd.get('is_blood_moon', False))][
+        _phase_index(lunar_day, cycle_length)]
+    phase_info = dict(record)
     phase_info['lunar_day'] = lunar_day
-
-    # Override name if blood moon
-    if phase_info['is_blood_moon']:
-        phase_info['name'] = "Blood Moon"
-
     return phase_info
 
 
@@ -493,8 +788,8 @@ def get_phase_start_day(phase_index: int, cycle_length: int) -> int:
     Returns:
         Starting lunar day for that phase (1-based)
     """
-    days_per_phase = cycle_length / 8.0
-    return math.ceil(phase_index * days_per_phase) + 1
+    # ceil(phase_index * cycle_length / 8) in integer arithmetic
+    return (phase_index * cycle_length + 7) // 8 + 1
 
 
 def advance_lunar_day(days: int = 1) -> bool:
@@ -514,48 +809,66 @@ def advance_lunar_day(days: int = 1) -> bool:
     Example:
         success = advance_lunar_day(1)
     """
-    import config  # Lazy import to avoid circular dependency
-    from data_loader import save_lunar_data
+    config = _cfg()
 
     # No calendar loaded
     if not config.calendar_data:
         return False
 
+    lunar_day, is_blood_moon = _advance_lunar_fields(days)
+    return _dl().save_lunar_data(lunar_day, is_blood_moon)
+
+
+def _advance_lunar_fields(days: int, unset_day: Optional[int] = None) -> tuple:
+    """
+    Compute the lunar day and blood moon status after advancing, without saving.
+
+    Shared core of advance_lunar_day and adjust_lunar_day. Rolls for blood
+    moon when the step enters the full moon phase. Caller must ensure
+    calendar_data exists.
+
+    Args:
+        days: Number of days to advance (negative deltas wrap correctly)
+        unset_day: Day to start from when lunar_day is not set
+                   (None = initialize randomly, as on a New Day advance)
+
+    Returns:
+        (lunar_day, is_blood_moon) after the advance
+    """
+    # Bind the dict once; this runs 4-5 gets against it per call
+    get = _cfg().calendar_data.get
+
     # Get current lunar data
-    lunar_day = config.calendar_data.get('lunar_day')
-    cycle_length = config.calendar_data.get('lunar_cycle_length', 27)
-    blood_moon_chance = config.calendar_data.get('blood_moon_chance', 10)
-    is_blood_moon = config.calendar_data.get('is_blood_moon', False)
+    lunar_day = get('lunar_day')
+    cycle_length = get('lunar_cycle_length', 27)
+    blood_moon_chance = get('blood_moon_chance', 10)
+    is_blood_moon = get('is_blood_moon', False)
 
     # If lunar_day not set, initialize it
     if lunar_day is None:
-        lunar_day = random.randint(1, cycle_length)
-
-    # Get phase before advancing
-    old_phase = get_moon_phase_for_day(lunar_day, cycle_length)
+        lunar_day = _rng.randint(1, cycle_length) if unset_day is None else unset_day
 
-    # Advance lunar day
-    lunar_day += days
+    # Phase index before advancing (no record lookup needed for the compare)
+    old_index = _phase_index(lunar_day, cycle_length)
 
-    # Handle cycle overflow
-    while lunar_day > cycle_length:
-        lunar_day -= cycle_length
+    # Advance lunar day; one modulo wraps any number of whole cycles
+    # (Python's % handles negative deltas too)
+    lunar_day = (lunar_day - 1 + days) % cycle_length + 1
 
-    # Get phase after advancing
-    new_phase = get_moon_phase_for_day(lunar_day, cycle_length)
+    # Phase index after advancing
+    new_index = _phase_index(lunar_day, cycle_length)
 
     # Check if we entered full moon phase
-    if new_phase['is_full_moon'] and not old_phase['is_full_moon']:
-        # Roll for blood moon
-        roll = random.randint(1, 100)
-        is_blood_moon = roll <= blood_moon_chance
-        verbose_print(f"Entering Full Moon phase. Blood moon roll: {roll} <= {blood_moon_chance}? {is_blood_moon}")
-    elif not new_phase['is_full_moon']:
+    if new_index == FULL_MOON_PHASE_INDEX and old_index != FULL_MOON_PHASE_INDEX:
+        # Roll for blood moon (single uniform draw instead of randint)
+        roll = _rand() * 100
+        is_blood_moon = roll < blood_moon_chance
+        verbose_print("Entering Full Moon phase. Blood moon roll: {:.1f} < {}? {}", roll, blood_moon_chance, is_blood_moon)
+    elif new_index != FULL_MOON_PHASE_INDEX:
         # Clear blood moon status when leaving full moon
         is_blood_moon = False
 
-    # Save lunar data
-    return save_lunar_data(lunar_day, is_blood_moon)
+    return (lunar_day, is_blood_moon)
 
 
 def set_lunar_day_to_phase(phase_index: int) -> bool:
@@ -572,19 +885,18 @@ def set_lunar_day_to_phase(phase_index: int) -> bool:
         # Set to Full Moon (phase index 4)
         success = set_lunar_day_to_phase(4)
     """
-    import config  # Lazy import to avoid circular dependency
-    from data_loader import save_lunar_data
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return False
 
     # Validate phase index
     if phase_index < 0 or phase_index > 7:
         return False
 
-    cycle_length = config.calendar_data.get('lunar_cycle_length', 27)
-    blood_moon_chance = config.calendar_data.get('blood_moon_chance', 10)
+    cycle_length = cd.get('lunar_cycle_length', 27)
+    blood_moon_chance = cd.get('blood_moon_chance', 10)
 
     # Calculate starting day for this phase
     lunar_day = get_phase_start_day(phase_index, cycle_length)
@@ -592,12 +904,12 @@ def set_lunar_day_to_phase(phase_index: int) -> bool:
     # Check if setting to full moon - roll for blood moon
     is_blood_moon = False
     if phase_index == FULL_MOON_PHASE_INDEX:
-        roll = random.randint(1, 100)
-        is_blood_moon = roll <= blood_moon_chance
-        verbose_print(f"Setting to Full Moon. Blood moon roll: {roll} <= {blood_moon_chance}? {is_blood_moon}")
+        roll = _rand() * 100
+        is_blood_moon = roll < blood_moon_chance
+        verbose_print("Setting to Full Moon. Blood moon roll: {:.1f} < {}? {}", roll, blood_moon_chance, is_blood_moon)
 
     # Save lunar data
-    return save_lunar_data(lunar_day, is_blood_moon)
+    return _dl().save_lunar_data(lunar_day, is_blood_moon)
 
 
 def adjust_lunar_day(delta: int) -> bool:
@@ -616,50 +928,14 @@ def adjust_lunar_day(delta: int) -> bool:
         adjust_lunar_day(1)   # Advance by 1
         adjust_lunar_day(-1)  # Go back by 1
     """
-    import config  # Lazy import to avoid circular dependency
-    from data_loader import save_lunar_data
-
     # No calendar loaded
-    if not config.calendar_data:
+    if not _cfg().calendar_data:
         return False
 
-    # Get current lunar data
-    lunar_day = config.calendar_data.get('lunar_day')
-    cycle_length = config.calendar_data.get('lunar_cycle_length', 27)
-    blood_moon_chance = config.calendar_data.get('blood_moon_chance', 10)
-    is_blood_moon = config.calendar_data.get('is_blood_moon', False)
-
-    # If lunar_day not set, initialize to 1
-    if lunar_day is None:
-        lunar_day = 1
-
-    # Get phase before adjusting
-    old_phase = get_moon_phase_for_day(lunar_day, cycle_length)
-
-    # Adjust lunar day
-    lunar_day += delta
-
-    # Handle wrapping
-    if lunar_day < 1:
-        lunar_day = cycle_length + lunar_day  # Wrap backwards
-    elif lunar_day > cycle_length:
-        lunar_day = lunar_day - cycle_length  # Wrap forwards
-
-    # Get phase after adjusting
-    new_phase = get_moon_phase_for_day(lunar_day, cycle_length)
-
-    # Check if we entered full moon phase
-    if new_phase['is_full_moon'] and not old_phase['is_full_moon']:
-        # Roll for blood moon
-        roll = random.randint(1, 100)
-        is_blood_moon = roll <= blood_moon_chance
-        verbose_print(f"Entering Full Moon phase. Blood moon roll: {roll} <= {blood_moon_chance}? {is_blood_moon}")
-    elif not new_phase['is_full_moon']:
-        # Clear blood moon status when leaving full moon
-        is_blood_moon = False
-
-    # Save lunar data
-    return save_lunar_data(lunar_day, is_blood_moon)
+    # Same step/blood-moon logic as advance_lunar_day; an unset day is
+    # treated as day 1 rather than randomized (manual +/- adjustment)
+    lunar_day, is_blood_moon = _advance_lunar_fields(delta, unset_day=1)
+    return _dl().save_lunar_data(lunar_day, is_blood_moon)
 
 
 def initialize_lunar_day() -> bool:
@@ -672,33 +948,32 @@ def initialize_lunar_day() -> bool:
     Example:
         initialize_lunar_day()  # Sets random lunar day if null
     """
-    import config  # Lazy import to avoid circular dependency
-    from data_loader import save_lunar_data
+    cd = _cfg().calendar_data
 
     # No calendar loaded
-    if not config.calendar_data:
+    if not cd:
         return False
 
     # Check if already set
-    lunar_day = config.calendar_data.get('lunar_day')
+    lunar_day = cd.get('lunar_day')
     if lunar_day is not None:
         return True  # Already initialized
 
     # Randomize lunar day
-    cycle_length = config.calendar_data.get('lunar_cycle_length', 27)
-    blood_moon_chance = config.calendar_data.get('blood_moon_chance', 10)
+    cycle_length = cd.get('lunar_cycle_length', 27)
+    blood_moon_chance = cd.get('blood_moon_chance', 10)
 
-    lunar_day = random.randint(1, cycle_length)
+    lunar_day = _rng.randint(1, cycle_length)
 
     # Check if we landed on full moon - roll for blood moon
     phase = get_moon_phase_for_day(lunar_day, cycle_length)
     is_blood_moon = False
     if phase['is_full_moon']:
-        roll = random.randint(1, 100)
-        is_blood_moon = roll <= blood_moon_chance
-        verbose_print(f"Initialized to Full Moon. Blood moon roll: {roll} <= {blood_moon_chance}? {is_blood_moon}")
+        roll = _rand() * 100
+        is_blood_moon = roll < blood_moon_chance
+        verbose_print("Initialized to Full Moon. Blood moon roll: {:.1f} < {}? {}", roll, blood_moon_chance, is_blood_moon)
 
-    verbose_print(f"Initialized lunar day to {lunar_day} ({phase['name']})")
+    verbose_print("Initialized lunar day to {} ({})", lunar_day, phase['name'])
 
     # Save lunar data
-    return save_lunar_data(lunar_day, is_blood_moon)
+    return _dl().save_lunar_data(lunar_day, is_blood_moon)